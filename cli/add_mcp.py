@@ -2,11 +2,38 @@ import os
 import sys
 import json
 import platform
-import subprocess
 import re
 from pathlib import Path
 import config_util  # Importar o módulo de utilitários de configuração
-import time
+from datetime import datetime
+
+# Usa orjson para serializar JSON quando disponível (bem mais rápido que o
+# json da stdlib); caso contrário usa o json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Padrões compilados uma única vez no carregamento do módulo, evitando o custo
+# de recompilação/consulta ao cache interno do re a cada chamada
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+_CAMINHO_PROJETO_RE = re.compile(r"Caminho do Projeto: (.+)")
+
+# Valores que não mudam durante a execução; calculados uma única vez
+_HOME = os.path.expanduser("~")
+_SYSTEM = platform.system()
+
+# Caminhos candidatos para o executável do UV, em ordem de preferência
+_UV_CANDIDATOS = (
+    os.path.join(_HOME, "pipx", "venvs", "uv", "Scripts", "uv.exe"),
+    os.path.join(_HOME, ".local", "pipx", "venvs", "uv", "bin", "uv"),
+)
+
+def json_indentado(obj):
+    """Serializa um objeto para JSON indentado, usando orjson se disponível."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=4)
 
 def cabecalho(titulo):
     """Exibe um cabeçalho estilizado no console."""
@@ -17,49 +44,63 @@ def cabecalho(titulo):
 
 def verificar_ambiente():
     """Verifica se o ambiente básico já foi configurado pelo quick_setup.py."""
-    # Verificar se a pasta mcp_server existe
-    if not os.path.exists("mcp_server"):
+    # Uma única varredura do diretório atual para localizar mcp_server e log.txt
+    tem_mcp_server = False
+    tem_log = False
+    try:
+        with os.scandir(".") as entradas:
+            for entrada in entradas:
+                if entrada.name == "mcp_server" and entrada.is_dir():
+                    tem_mcp_server = True
+                elif entrada.name == "log.txt" and entrada.is_file():
+                    tem_log = True
+    except OSError:
+        pass
+
+    if not tem_mcp_server:
         print("Erro: A pasta 'mcp_server' não foi encontrada!")
         print("Execute primeiro o script quick_setup.py para criar o ambiente básico.")
         return False
-    
+
     # Determinar o caminho do projeto ("mcp_server")
     projeto_dir = "mcp_server"
-    
-    # Verificar se o ambiente virtual existe
+
+    # Verificar se o ambiente virtual existe (isdir já cobre a existência)
     venv_path = os.path.join(projeto_dir, ".venv")
-    if not os.path.exists(venv_path) or not os.path.isdir(venv_path):
+    if not os.path.isdir(venv_path):
         print(f"Erro: O ambiente virtual não foi encontrado em {projeto_dir}/.venv!")
         print("Execute primeiro o script quick_setup.py para criar o ambiente básico.")
         return False
-    
-    # Verificar se o log.txt existe
-    if not os.path.exists("log.txt"):
+
+    if not tem_log:
         print("Erro: O arquivo log.txt não foi encontrado!")
         print("Execute primeiro o script quick_setup.py para criar o ambiente básico.")
         return False
-    
+
     return True
 
 def obter_info_base():
     """Obtém informações básicas do ambiente MCP já configurado."""
     try:
-        # Ler log.txt para obter informações
-        with open("log.txt", "r", encoding="utf-8") as f:
-            conteudo = f.read()
+        # Ler log.txt para obter informações (leitura única, sem camada de buffer)
+        conteudo = Path("log.txt").read_bytes().decode("utf-8")
         
         # Obter caminho do projeto
-        match = re.search(r"Caminho do Projeto: (.+)", conteudo)
+        match = _CAMINHO_PROJETO_RE.search(conteudo)
         if match:
             caminho_projeto = match.group(1)
         else:
             caminho_projeto = os.path.abspath("mcp_server")
         
-        # Determinar o caminho do UV
-        uv_path = os.path.join(os.path.expanduser("~"), "pipx", "venvs", "uv", "Scripts", "uv.exe")
-        if not os.path.exists(uv_path) and platform.system() != "Windows":
-            uv_path = os.path.join(os.path.expanduser("~"), ".local", "pipx", "venvs", "uv", "bin", "uv")
-        if not os.path.exists(uv_path):
+        # Determinar o caminho do UV com um único stat por candidato
+        for candidato in _UV_CANDIDATOS:
+            try:
+                os.stat(candidato)
+                uv_path = candidato
+                break
+            except OSError:
+                continue
+        else:
             uv_path = "uv"
         
         return {
@@ -73,11 +114,9 @@ def obter_info_base():
             "uv_path": "uv"
         }
 
-def criar_modelo_servidor(nome_arquivo, nome_mcp):
-    """Cria um arquivo de servidor MCP personalizado."""
-    
-    # Usamos f-string tripla com aspas simples para evitar problemas de escape
-    conteudo = f'''#!/usr/bin/env python3
+# Modelo do servidor gerado, constante no módulo; a parte estática é montada
+# uma única vez e apenas {nome_arquivo}/{nome_mcp} são substituídos por chamada
+_SERVER_TEMPLATE = '''#!/usr/bin/env python3
 # {nome_arquivo} - Servidor MCP personalizado para {nome_mcp}
 # Criado automaticamente por add_mcp.py
 
@@ -156,13 +195,20 @@ if __name__ == "__main__":
     print("Use a ferramenta 'config_info' para ver as informações de configuração")
     mcp.run(transport='stdio')
 '''
-    return conteudo
+
+def criar_modelo_servidor(nome_arquivo, nome_mcp):
+    """Cria um arquivo de servidor MCP personalizado."""
+    return _SERVER_TEMPLATE.format(nome_arquivo=nome_arquivo, nome_mcp=nome_mcp)
 
 def main():
     """Função principal para adicionar um novo MCP."""
     cabecalho("ADICIONAR NOVO SERVIDOR MCP PERSONALIZADO")
-    print("Este script permite adicionar um novo servidor MCP personalizado.")
-    print("O ambiente básico (quick_setup.py) já deve ter sido executado anteriormente.")
+    # Agrupa as mensagens de cada seção em uma única escrita no stdout,
+    # evitando o custo por chamada de print (lock + encode + flush)
+    sys.stdout.write(
+        "Este script permite adicionar um novo servidor MCP personalizado.\n"
+        "O ambiente básico (quick_setup.py) já deve ter sido executado anteriormente.\n"
+    )
     
     # Verificar se o ambiente está configurado
     if not verificar_ambiente():
@@ -174,8 +220,10 @@ def main():
     uv_path = info["uv_path"]
     
     # Solicitar nome do MCP
-    print("\nEscolha um nome para o seu novo servidor MCP:")
-    print("(Este nome será usado para identificar o servidor na configuração)")
+    sys.stdout.write(
+        "\nEscolha um nome para o seu novo servidor MCP:\n"
+        "(Este nome será usado para identificar o servidor na configuração)\n"
+    )
     nome_mcp = input("> ").strip()
     
     if not nome_mcp:
@@ -183,14 +231,16 @@ def main():
         sys.exit(1)
     
     # Validar o nome (remover caracteres especiais)
-    nome_mcp_limpo = re.sub(r'[^a-zA-Z0-9_]', '_', nome_mcp)
+    nome_mcp_limpo = _SANITIZE_RE.sub('_', nome_mcp)
     if nome_mcp != nome_mcp_limpo:
         print(f"Nome ajustado para: {nome_mcp_limpo}")
         nome_mcp = nome_mcp_limpo
     
     # Solicitar nome do arquivo
-    print("\nEscolha um nome para o arquivo do servidor (sem a extensão .py):")
-    print("(Este será o nome do arquivo que contém o código do servidor)")
+    sys.stdout.write(
+        "\nEscolha um nome para o arquivo do servidor (sem a extensão .py):\n"
+        "(Este será o nome do arquivo que contém o código do servidor)\n"
+    )
     nome_arquivo = input("> ").strip()
     
     if not nome_arquivo:
@@ -199,7 +249,7 @@ def main():
         print(f"Usando o nome padrão: {nome_arquivo}")
     
     # Validar o nome do arquivo
-    nome_arquivo_limpo = re.sub(r'[^a-zA-Z0-9_]', '_', nome_arquivo)
+    nome_arquivo_limpo = _SANITIZE_RE.sub('_', nome_arquivo)
     if nome_arquivo != nome_arquivo_limpo:
         print(f"Nome do arquivo ajustado para: {nome_arquivo_limpo}")
         nome_arquivo = nome_arquivo_limpo
@@ -222,8 +272,8 @@ def main():
     # Criar o arquivo do servidor
     try:
         conteudo = criar_modelo_servidor(nome_arquivo, nome_mcp)
-        with open(caminho_arquivo, "w", encoding="utf-8") as f:
-            f.write(conteudo)
+        # Escrita binária única, sem a camada de tradução do modo texto
+        Path(caminho_arquivo).write_bytes(conteudo.encode("utf-8"))
         print(f"\n✅ Arquivo {nome_arquivo} criado com sucesso em {caminho_projeto}")
     except Exception as e:
         print(f"Erro ao criar o arquivo: {e}")
@@ -244,7 +294,7 @@ def main():
                 "command": uv_path,
                 "args": argumentos,
                 "metadata": {
-                    "created": time.strftime("%Y-%m-%d %H:%M:%S")
+                    "created": datetime.now().isoformat(sep=" ", timespec="seconds")
                 }
             }
         }
@@ -252,27 +302,31 @@ def main():
     
     # Exibir a configuração para o usuário
     cabecalho("CONFIGURAÇÃO PARA O CLAUDE/CURSOR")
-    print("\nCopie o JSON abaixo e adicione à configuração do seu cliente:")
-    print("\nPara Cursor:")
-    print("  Arquivo: C:\\Users\\<seu_usuario>\\.cursor\\mcp.json")
-    print("\nPara Claude for Desktop:")
-    if platform.system() == "Windows":
-        print("  Arquivo: %USERPROFILE%\\AppData\\Roaming\\Claude\\claude_desktop_config.json")
+    out = [
+        "\nCopie o JSON abaixo e adicione à configuração do seu cliente:",
+        "\nPara Cursor:",
+        "  Arquivo: C:\\Users\\<seu_usuario>\\.cursor\\mcp.json",
+        "\nPara Claude for Desktop:",
+    ]
+    if _SYSTEM == "Windows":
+        out.append("  Arquivo: %USERPROFILE%\\AppData\\Roaming\\Claude\\claude_desktop_config.json")
     else:
-        print("  Arquivo: ~/Library/Application Support/Claude/claude_desktop_config.json")
-    
-    print("\nConfiguração JSON:")
-    print(json.dumps(config["mcpServers"][nome_mcp], indent=4))
-    
-    print("\n📋 Exemplo completo (integre com sua configuração existente):")
-    print(json.dumps(config, indent=4))
-    
+        out.append("  Arquivo: ~/Library/Application Support/Claude/claude_desktop_config.json")
+
+    # Serializa as duas visões uma única vez
+    out.append("\nConfiguração JSON:")
+    out.append(json_indentado(config["mcpServers"][nome_mcp]))
+    out.append("\n📋 Exemplo completo (integre com sua configuração existente):")
+    out.append(json_indentado(config))
+
     # Mostrar comando para executar o servidor
-    print(f"\nPara executar o servidor manualmente:")
-    print(f"{uv_path} --directory {caminho_projeto} run {nome_arquivo}")
-    
+    out.append("\nPara executar o servidor manualmente:")
+    out.append(f"{uv_path} --directory {caminho_projeto} run {nome_arquivo}")
+
     # Atualizar automaticamente os arquivos de configuração
-    print("\n🔄 Atualizando configurações das IDEs automaticamente...")
+    out.append("\n🔄 Atualizando configurações das IDEs automaticamente...")
+    sys.stdout.write("\n".join(out) + "\n")
+    out.clear()
     
     # Criar configuração para o módulo de utilitários
     resultado = config_util.atualizar_configuracoes(
@@ -283,26 +337,27 @@ def main():
     
     # Mostrar resultados da atualização
     if resultado["cursor"]["status"] == "sucesso":
-        print(f"✅ Cursor: Configuração atualizada em {resultado['cursor']['caminho']}")
+        out.append(f"✅ Cursor: Configuração atualizada em {resultado['cursor']['caminho']}")
     else:
-        print(f"❌ Cursor: {resultado['cursor']['mensagem']}")
-        
+        out.append(f"❌ Cursor: {resultado['cursor']['mensagem']}")
+
     if resultado["claude"]["status"] == "sucesso":
-        print(f"✅ Claude Desktop: Configuração atualizada em {resultado['claude']['caminho']}")
+        out.append(f"✅ Claude Desktop: Configuração atualizada em {resultado['claude']['caminho']}")
     else:
-        print(f"❌ Claude Desktop: {resultado['claude']['mensagem']}")
-    
+        out.append(f"❌ Claude Desktop: {resultado['claude']['mensagem']}")
+
     # Instruções finais
-    print("\n🎉 Servidor MCP criado e configurado com sucesso!")
-    print("Para executar o servidor, basta reiniciar o Claude Desktop")
-    print("Ou execute manualmente com os comandos:")
-    print(f"  cd {caminho_projeto}")
-    print(f"  {uv_path} activate")
-    print(f"  {uv_path} run {nome_arquivo}")
-    
+    out.append("\n🎉 Servidor MCP criado e configurado com sucesso!")
+    out.append("Para executar o servidor, basta reiniciar o Claude Desktop")
+    out.append("Ou execute manualmente com os comandos:")
+    out.append(f"  cd {caminho_projeto}")
+    out.append(f"  {uv_path} activate")
+    out.append(f"  {uv_path} run {nome_arquivo}")
+
     # Adicionar aviso final
-    print("\n⚠️ IMPORTANTE: O servidor já está disponível e ativo no Cursor!")
-    print("   Não é necessário executá-lo manualmente a menos que deseje fazê-lo posteriormente.")
+    out.append("\n⚠️ IMPORTANTE: O servidor já está disponível e ativo no Cursor!")
+    out.append("   Não é necessário executá-lo manualmente a menos que deseje fazê-lo posteriormente.")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,23 +1,33 @@
 import json
 import os
 import platform
-import sys
 from pathlib import Path
 
+# Usa orjson para ler/gravar JSON quando disponível (parse e serialização
+# bem mais rápidos que o json da stdlib); caso contrário usa o json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Valores que não mudam durante a execução; calculados uma única vez
+_HOME = os.path.expanduser("~")
+_SYSTEM = platform.system()
+
+# Caminhos de configuração dos clientes, montados uma única vez no import
+
+# Caminho para o arquivo de configuração do Cursor
+_CURSOR_CONFIG = os.path.join(_HOME, ".cursor", "mcp.json")
+
+# Caminho para o arquivo de configuração do Claude Desktop
+if _SYSTEM == "Windows":
+    _CLAUDE_CONFIG = os.path.join(_HOME, "AppData", "Roaming", "Claude", "claude_desktop_config.json")
+else:  # macOS
+    _CLAUDE_CONFIG = os.path.join(_HOME, "Library", "Application Support", "Claude", "claude_desktop_config.json")
+
 def obter_caminhos_config():
     """Retorna os caminhos para os arquivos de configuração do Cursor e Claude Desktop."""
-    home = os.path.expanduser("~")
-    
-    # Caminho para o arquivo de configuração do Cursor
-    cursor_config = os.path.join(home, ".cursor", "mcp.json")
-    
-    # Caminho para o arquivo de configuração do Claude Desktop
-    if platform.system() == "Windows":
-        claude_config = os.path.join(home, "AppData", "Roaming", "Claude", "claude_desktop_config.json")
-    else:  # macOS
-        claude_config = os.path.join(home, "Library", "Application Support", "Claude", "claude_desktop_config.json")
-    
-    return cursor_config, claude_config
+    return _CURSOR_CONFIG, _CLAUDE_CONFIG
 
 def atualizar_configuracoes(nome_servidor, comando, argumentos):
     """
@@ -68,30 +78,38 @@ def atualizar_arquivo_configuracao(caminho_arquivo, nome_servidor, nova_config):
         nome_servidor: Nome do servidor MCP
         nova_config: Configuração a ser adicionada
     """
-    # Verificar se o diretório existe, se não, criar
+    # Criar o diretório se necessário (exist_ok dispensa a checagem prévia)
     diretorio = os.path.dirname(caminho_arquivo)
-    if not os.path.exists(diretorio):
-        os.makedirs(diretorio, exist_ok=True)
+    os.makedirs(diretorio, exist_ok=True)
     
     # Se o arquivo não existir, criar com a estrutura básica
     if not os.path.exists(caminho_arquivo):
         config = {"mcpServers": {}}
     else:
-        # Ler configuração existente
+        # Ler configuração existente (leitura única, sem camada de buffer)
         try:
-            with open(caminho_arquivo, "r", encoding="utf-8") as f:
-                config = json.load(f)
-        except json.JSONDecodeError:
+            raw = Path(caminho_arquivo).read_bytes()
+            if orjson is not None:
+                config = orjson.loads(raw)
+            else:
+                config = json.loads(raw)
+        except ValueError:
             # Se o arquivo existe mas não é um JSON válido
             config = {"mcpServers": {}}
-        
-        # Garantir que a estrutura de mcpServers existe
-        if "mcpServers" not in config:
-            config["mcpServers"] = {}
-    
+
+    # Garantir que a estrutura de mcpServers existe
+    servidores = config.setdefault("mcpServers", {})
+
+    # Se a entrada já está idêntica, não há nada a serializar nem gravar
+    if servidores.get(nome_servidor) == nova_config:
+        return
+
     # Adicionar ou atualizar a configuração do servidor
-    config["mcpServers"][nome_servidor] = nova_config
+    servidores[nome_servidor] = nova_config
     
-    # Salvar o arquivo atualizado
-    with open(caminho_arquivo, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=4) 
\ No newline at end of file
+    # Salvar o arquivo atualizado (escrita binária única, sem camada de texto)
+    if orjson is not None:
+        dados = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        dados = json.dumps(config, indent=4).encode("utf-8")
+    Path(caminho_arquivo).write_bytes(dados) 
\ No newline at end of file
@@ -6,7 +6,9 @@ import sys
 import json
 import platform
 import subprocess
+import functools
 import psutil
+import select
 import socket
 import time
 import re
@@ -15,9 +17,112 @@ from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 
+# Usa orjson para decodificar os JSON de configuração quando disponível
+# (parse bem mais rápido que o json da stdlib); senão usa o json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Inicializa o console do Rich para saída formatada
 console = Console()
 
+# Valores que não mudam durante a execução; calculados uma única vez
+_HOME = os.path.expanduser("~")
+_IS_WINDOWS = (platform.system() == "Windows")
+
+# Caminhos de configuração dos clientes, montados uma única vez no import
+
+# Caminho para o arquivo de configuração do Cursor
+_CURSOR_CONFIG = os.path.join(_HOME, ".cursor", "mcp.json")
+
+# Caminho para o arquivo de configuração do Claude Desktop
+if _IS_WINDOWS:
+    _CLAUDE_CONFIG = os.path.join(_HOME, "AppData", "Roaming", "Claude", "claude_desktop_config.json")
+else:  # macOS
+    _CLAUDE_CONFIG = os.path.join(_HOME, "Library", "Application Support", "Claude", "claude_desktop_config.json")
+
+# Subcaminhos do ambiente virtual resolvidos uma vez conforme a plataforma
+if _IS_WINDOWS:
+    _ACTIVATE_REL = ("Scripts", "activate.bat")
+    _PY_REL = ("Scripts", "python.exe")
+    _BIN_REL = "Scripts"
+else:
+    _ACTIVATE_REL = ("bin", "activate")
+    _PY_REL = ("bin", "python")
+    _BIN_REL = "bin"
+
+# Buffer explícito de 128 KiB para leituras de arquivos de log/configuração;
+# evita o buffer minúsculo derivado de st_blksize em alguns sistemas de arquivos
+_READ_BUF = 1 << 17
+
+# Padrões e constantes de varredura compilados uma única vez no import
+_RE_CAMINHO_PROJETO = re.compile(r"Caminho do Projeto: (.+)")
+_MCP_KEYWORDS = ("mcp", "demon.py", ".py")
+_STDIO_EQ = frozenset(("transport=stdio", "--transport=stdio", "-t=stdio"))
+_TRANSPORT_FLAGS = frozenset(("transport", "--transport", "-t"))
+
+# Marcadores de fronteira para detectar "mcp_server" como componente do
+# caminho sem alocar uma lista via split a cada processo
+_MCP_DIR_MID = os.sep + "mcp_server" + os.sep
+_MCP_DIR_END = os.sep + "mcp_server"
+
+# Classificação do tipo de atividade sem desvios: índice = (porta_ativa<<1)|usando_stdio
+_TIPO_ATIVO = (None, "stdio", "http", "http")
+
+# Rótulos de exibição para cada tipo de atividade
+_TIPO_DISPLAY = {"http": "HTTP", "stdio": "STDIO", None: "INATIVO"}
+
+# Cache de resultados de stat por caminho; evita repetir o mesmo syscall
+# para os caminhos fixos sondados em verificar_e_ativar_ambiente
+_STAT_CACHE = {}
+
+# Cache dos JSON de configuração indexado por caminho -> (mtime_ns, dados);
+# evita reparsear os arquivos a cada volta do menu quando nada mudou
+_CFG_CACHE = {}
+
+@functools.lru_cache(maxsize=32)
+def _resolve_venv(venv_path):
+    """Resolve (activate_script, python_exe) de um venv uma única vez por sessão."""
+    act = os.path.join(venv_path, *_ACTIVATE_REL)
+    py = os.path.join(venv_path, *_PY_REL)
+    return (act, py) if os.path.exists(act) else (None, None)
+
+def _dim(msg):
+    """Imprime um diagnóstico esmaecido sem passar pelo parser de markup do Rich."""
+    console.print(msg, style="dim", markup=False, highlight=False)
+
+def _loads(raw):
+    """Decodifica bytes JSON com orjson quando disponível."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _dumps(obj):
+    """Serializa um objeto para bytes JSON indentados com orjson quando disponível."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def _carregar_json_cacheado(caminho):
+    """Lê e decodifica um arquivo JSON, reaproveitando o resultado enquanto o mtime não mudar."""
+    st = os.stat(caminho)
+    cache = _CFG_CACHE.get(caminho)
+    if cache is not None and cache[0] == st.st_mtime_ns:
+        return cache[1]
+    dados = _loads(Path(caminho).read_bytes())
+    _CFG_CACHE[caminho] = (st.st_mtime_ns, dados)
+    return dados
+
+def _cached_exists(caminho):
+    """Versão memoizada de os.path.exists baseada em um único os.stat por caminho."""
+    if caminho in _STAT_CACHE:
+        return _STAT_CACHE[caminho] is not None
+    try:
+        resultado = os.stat(caminho)
+    except OSError:
+        resultado = None
+    _STAT_CACHE[caminho] = resultado
+    return resultado is not None
+
 def verificar_e_ativar_ambiente():
     """Verifica se o ambiente virtual mencionado no log.txt está ativado, e o ativa caso necessário."""
     try:
@@ -29,22 +134,18 @@ def verificar_e_ativar_ambiente():
             os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "log.txt")  # Diretório pai do script
         ]
         
-        log_path = None
-        for path in log_paths:
-            if os.path.exists(path):
-                log_path = path
-                break
-        
+        log_path = next((path for path in log_paths if _cached_exists(path)), None)
+
         if not log_path:
             console.print("[yellow]Arquivo log.txt não encontrado em nenhum dos caminhos pesquisados. O ambiente virtual não pode ser ativado automaticamente.[/yellow]")
             return False
         
         # Ler o log.txt para obter informações do projeto
-        with open(log_path, "r", encoding="utf-8") as f:
+        with open(log_path, "r", encoding="utf-8", buffering=_READ_BUF) as f:
             conteudo_log = f.read()
         
         # Extrair o caminho do projeto
-        caminho_match = re.search(r"Caminho do Projeto: (.+)", conteudo_log)
+        caminho_match = _RE_CAMINHO_PROJETO.search(conteudo_log)
         if not caminho_match:
             console.print("[yellow]Não foi possível encontrar o caminho do projeto no log.txt.[/yellow]")
             return False
@@ -52,7 +153,7 @@ def verificar_e_ativar_ambiente():
         caminho_projeto = caminho_match.group(1).strip()
         
         # Verificar se o diretório do projeto existe
-        if not os.path.exists(caminho_projeto):
+        if not _cached_exists(caminho_projeto):
             console.print(f"[yellow]O diretório do projeto não foi encontrado: {caminho_projeto}[/yellow]")
             return False
         
@@ -65,69 +166,31 @@ def verificar_e_ativar_ambiente():
         
         # Verificar se existe um ambiente virtual no projeto
         venv_path = os.path.join(caminho_projeto, ".venv")
-        if not os.path.exists(venv_path):
+        if not _cached_exists(venv_path):
             console.print(f"[yellow]Não foi encontrado ambiente virtual em: {venv_path}[/yellow]")
             return False
         
         # Se o ambiente virtual não estiver ativo, ativá-lo
         if not venv_ativo:
-            # Determinar caminhos de ativação do ambiente virtual
-            if platform.system() == "Windows":
-                activate_script = os.path.join(venv_path, "Scripts", "activate.bat")
-                python_exe = os.path.join(venv_path, "Scripts", "python.exe")
-            else:
-                activate_script = os.path.join(venv_path, "bin", "activate")
-                python_exe = os.path.join(venv_path, "bin", "python")
-            
-            if not os.path.exists(activate_script):
-                console.print(f"[yellow]Script de ativação não encontrado: {activate_script}[/yellow]")
+            # Determinar caminhos de ativação do ambiente virtual (resolvidos
+            # e validados uma única vez por venv durante a sessão)
+            activate_script, python_exe = _resolve_venv(venv_path)
+
+            if activate_script is None:
+                console.print(f"[yellow]Script de ativação não encontrado em: {venv_path}[/yellow]")
                 return False
             
-            # Em vez de reiniciar em uma nova janela, vamos modificar as variáveis de ambiente
-            # para simular a ativação do ambiente virtual
-            if platform.system() == "Windows":
-                # No Windows, precisamos executar o script de ativação e capturar as variáveis de ambiente alteradas
-                # Cria um script temporário para capturar o ambiente
-                temp_script = "temp_env_capture.bat"
-                with open(temp_script, "w", encoding="cp1252") as f:
-                    f.write("@echo off\n")
-                    f.write(f"call \"{activate_script}\"\n")
-                    f.write("set > env_vars.txt\n")
-                
-                # Executa o script para capturar as variáveis de ambiente
-                subprocess.run(["cmd", "/c", temp_script], capture_output=True)
-                
-                # Lê as variáveis de ambiente capturadas
-                with open("env_vars.txt", "r") as f:
-                    env_vars = f.readlines()
-                
-                # Atualiza as variáveis de ambiente do processo atual
-                for line in env_vars:
-                    if "=" in line:
-                        name, value = line.strip().split("=", 1)
-                        os.environ[name] = value
-                
-                # Limpa arquivos temporários
-                if os.path.exists(temp_script):
-                    os.remove(temp_script)
-                if os.path.exists("env_vars.txt"):
-                    os.remove("env_vars.txt")
-                
-                console.print(f"[green]Ambiente virtual ativado em background com sucesso![/green]")
-            else:
-                # No Linux/macOS, podemos ativar diretamente
-                source_cmd = f"source {activate_script}"
-                subprocess.run(source_cmd, shell=True, executable="/bin/bash")
-                console.print(f"[green]Ambiente virtual ativado em background com sucesso![/green]")
-            
-            # Defina a variável de ambiente para indicar que o ambiente virtual está ativado
+            # A "ativação" de um venv se resume a ajustar variáveis de ambiente;
+            # fazemos isso diretamente no processo atual, sem subprocess nem
+            # arquivos temporários (o activate.bat/source só faz isso num shell filho)
             os.environ['VIRTUAL_ENV'] = venv_path
             # Adiciona o diretório bin/Scripts ao PATH
-            if platform.system() == "Windows":
-                bin_dir = os.path.join(venv_path, "Scripts")
-            else:
-                bin_dir = os.path.join(venv_path, "bin")
+            bin_dir = os.path.join(venv_path, _BIN_REL)
             os.environ['PATH'] = bin_dir + os.pathsep + os.environ['PATH']
+            # PYTHONHOME conflita com o venv; remove se estiver definido
+            os.environ.pop('PYTHONHOME', None)
+
+            console.print(f"[green]Ambiente virtual ativado em background com sucesso![/green]")
             
         return True
     
@@ -138,26 +201,27 @@ def verificar_e_ativar_ambiente():
 # Obtém o PID do processo atual para filtrar da listagem
 CURRENT_PID = os.getpid()
 
+# Entrada interativa? Em execuções não interativas (pipe/CI) os prompts de
+# pausa são pulados em vez de bloquear em EOF
+_ISATTY = sys.stdin.isatty()
+
+def pausar():
+    """Aguarda ENTER quando há terminal; leitura direta, sem iniciar o readline."""
+    if _ISATTY:
+        sys.stdout.write("\nPressione ENTER para continuar...")
+        sys.stdout.flush()
+        sys.stdin.readline()
+
+# Linha separadora do cabeçalho, montada uma única vez
+_RULE = "=" * 60
+
 def cabecalho(titulo):
     """Exibe um cabeçalho estilizado no console."""
-    console.print(f"\n[bold cyan]{'=' * 60}[/bold cyan]")
-    console.print(f"[bold cyan]{titulo.center(60)}[/bold cyan]")
-    console.print(f"[bold cyan]{'=' * 60}[/bold cyan]")
+    console.print(f"\n[bold cyan]{_RULE}\n{titulo.center(60)}\n{_RULE}[/bold cyan]")
 
 def obter_caminhos_config():
     """Retorna os caminhos para os arquivos de configuração do Cursor e Claude Desktop."""
-    home = os.path.expanduser("~")
-    
-    # Caminho para o arquivo de configuração do Cursor
-    cursor_config = os.path.join(home, ".cursor", "mcp.json")
-    
-    # Caminho para o arquivo de configuração do Claude Desktop
-    if platform.system() == "Windows":
-        claude_config = os.path.join(home, "AppData", "Roaming", "Claude", "claude_desktop_config.json")
-    else:  # macOS
-        claude_config = os.path.join(home, "Library", "Application Support", "Claude", "claude_desktop_config.json")
-    
-    return cursor_config, claude_config
+    return _CURSOR_CONFIG, _CLAUDE_CONFIG
 
 def carregar_configuracoes():
     """Carrega as configurações dos servidores MCP dos arquivos de configuração."""
@@ -167,31 +231,32 @@ def carregar_configuracoes():
         "claude": {"caminho": claude_config, "servidores": {}, "status": "não encontrado"}
     }
     
-    # Tenta carregar a configuração do Cursor
-    if os.path.exists(cursor_config):
-        try:
-            with open(cursor_config, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
-                if 'mcpServers' in dados:
-                    configs["cursor"]["servidores"] = dados['mcpServers']
-                    configs["cursor"]["status"] = "carregado"
-                    console.print(f"[dim]Configuração do Cursor carregada: {len(dados['mcpServers'])} servidores[/dim]")
-        except Exception as e:
-            configs["cursor"]["status"] = f"erro: {str(e)}"
-            console.print(f"[yellow]Erro ao carregar configuração do Cursor: {str(e)}[/yellow]")
-    
+    # Tenta carregar a configuração do Cursor (sem os.path.exists prévio:
+    # a ausência do arquivo vira FileNotFoundError, poupando um stat)
+    try:
+        dados = _carregar_json_cacheado(cursor_config)
+        if 'mcpServers' in dados:
+            configs["cursor"]["servidores"] = dados['mcpServers']
+            configs["cursor"]["status"] = "carregado"
+            _dim(f"Configuração do Cursor carregada: {len(dados['mcpServers'])} servidores")
+    except FileNotFoundError:
+        pass  # status permanece "não encontrado"
+    except Exception as e:
+        configs["cursor"]["status"] = f"erro: {str(e)}"
+        console.print(f"[yellow]Erro ao carregar configuração do Cursor: {str(e)}[/yellow]")
+
     # Tenta carregar a configuração do Claude Desktop
-    if os.path.exists(claude_config):
-        try:
-            with open(claude_config, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
-                if 'mcpServers' in dados:
-                    configs["claude"]["servidores"] = dados['mcpServers']
-                    configs["claude"]["status"] = "carregado"
-                    console.print(f"[dim]Configuração do Claude carregada: {len(dados['mcpServers'])} servidores[/dim]")
-        except Exception as e:
-            configs["claude"]["status"] = f"erro: {str(e)}"
-            console.print(f"[yellow]Erro ao carregar configuração do Claude: {str(e)}[/yellow]")
+    try:
+        dados = _carregar_json_cacheado(claude_config)
+        if 'mcpServers' in dados:
+            configs["claude"]["servidores"] = dados['mcpServers']
+            configs["claude"]["status"] = "carregado"
+            _dim(f"Configuração do Claude carregada: {len(dados['mcpServers'])} servidores")
+    except FileNotFoundError:
+        pass  # status permanece "não encontrado"
+    except Exception as e:
+        configs["claude"]["status"] = f"erro: {str(e)}"
+        console.print(f"[yellow]Erro ao carregar configuração do Claude: {str(e)}[/yellow]")
     
     return configs
 
@@ -204,87 +269,89 @@ def verificar_porta_em_uso(porta):
         return False
 
 def obter_processos_python():
-    """Retorna todos os processos Python em execução."""
-    processos_python = []
-    
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time', 'cwd', 'ppid']):
+    """Gera os processos Python em execução.
+
+    Busca apenas pid/name nesta passada; atributos caros (cmdline, cwd etc.)
+    são obtidos sob demanda apenas para os candidatos que passarem no filtro.
+    """
+    for proc in psutil.process_iter(['pid', 'name']):
         try:
+            # Ignora o próprio launcher antes de qualquer outro trabalho
+            if proc.info['pid'] == CURRENT_PID:
+                continue
             # Filtra apenas processos Python
             if proc.info['name'] and 'python' in proc.info['name'].lower():
-                processos_python.append(proc)
+                yield proc
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
-    
-    return processos_python
 
 def identificar_servidores_mcp(processos):
     """Identifica quais processos Python estão executando servidores MCP."""
     servidores_mcp = []
-    grupos_servidores = {}  # Para agrupar processos relacionados
     processos_filhos = set()  # Para identificar processos filhos
+
+    # Subárvore do próprio launcher (ele mesmo + descendentes, como o
+    # add_mcp.py disparado pelo menu); rejeitada em O(1) antes de qualquer
+    # leitura de cmdline
+    try:
+        arvore_propria = {CURRENT_PID} | {c.pid for c in psutil.Process(CURRENT_PID).children(recursive=True)}
+    except psutil.Error:
+        arvore_propria = {CURRENT_PID}
+
+    # Uma única consulta ao kernel pelas portas em escuta, em vez de um
+    # connect TCP (SYN/RST completo) por candidato
+    try:
+        portas_em_escuta = frozenset(
+            c.laddr.port for c in psutil.net_connections(kind='inet')
+            if c.status == psutil.CONN_LISTEN and c.laddr
+        )
+    except (psutil.AccessDenied, PermissionError):
+        portas_em_escuta = None
     
     # Primeiro passo: identificar todos os processos MCP
     for proc in processos:
         try:
-            # Ignora o processo atual
-            if proc.info['pid'] == CURRENT_PID:
+            # Ignora processos da subárvore do launcher
+            if proc.info['pid'] in arvore_propria:
                 continue
-                
-            cmdline = proc.info['cmdline']
+
+            # Linha de comando buscada sob demanda, somente para candidatos
+            cmdline = proc.cmdline()
             if not cmdline:
                 continue
-            
-            # Identifica servidor MCP pelos parâmetros na linha de comando
-            is_mcp = False
-            
-            # Verifica se é o launcher.py sendo executado (não o processo atual)
-            is_launcher = False
-            for cmd in cmdline:
-                if "launcher.py" in cmd:
-                    is_launcher = True
-                    break
-            
-            # Se for o script launcher.py, pula este processo
-            if is_launcher:
+
+            # Interpretador sozinho (sem script) não é candidato a servidor MCP
+            if len(cmdline) < 2:
                 continue
-            
-            # Palavras-chave para identificar processos MCP
-            keywords = ["mcp", "demon.py", ".py"]
-            for keyword in keywords:
-                for cmd in cmdline:
-                    if keyword in cmd:
-                        is_mcp = True
-                        break
-                if is_mcp:
-                    break
-            
+
+
+            # Se for o script launcher.py, pula este processo (não o atual)
+            if any("launcher.py" in cmd for cmd in cmdline):
+                continue
+
+            # Identifica servidor MCP pelos parâmetros na linha de comando
+            is_mcp = any(keyword in cmd for cmd in cmdline for keyword in _MCP_KEYWORDS)
+
             if is_mcp:
                 # Tenta encontrar a porta do servidor
                 porta = None
                 nome_projeto = "Desconhecido"
-                arquivo_python = "Desconhecido"
-                
-                # Procura pelo arquivo .py no comando
-                for i, cmd in enumerate(cmdline):
-                    # Verifica se é um arquivo .py
-                    if cmd.endswith('.py'):
-                        arquivo_python = os.path.basename(cmd)
-                        break
-                    # Caso especial para "run" seguido do arquivo .py
-                    elif cmd == 'run' and i+1 < len(cmdline) and cmdline[i+1].endswith('.py'):
-                        arquivo_python = os.path.basename(cmdline[i+1])
-                        break
-                    # Verifica outros padrões comuns
-                    elif 'python' in cmd.lower() and i+1 < len(cmdline) and cmdline[i+1].endswith('.py'):
-                        arquivo_python = os.path.basename(cmdline[i+1])
-                        break
-                
-                # Obtém o diretório e nome do projeto
+
+                # Procura pelo arquivo .py no comando (uma única passada; os
+                # padrões "run <arquivo>.py" e "python <arquivo>.py" caem no
+                # mesmo teste de sufixo)
+                arquivo_python = next(
+                    (os.path.basename(cmd) for cmd in cmdline if cmd.endswith('.py')),
+                    "Desconhecido"
+                )
+
+                # Obtém o diretório e nome do projeto (cwd é caro: busca apenas
+                # depois que o processo já foi identificado como MCP)
                 try:
-                    diretorio = proc.info['cwd']
-                    
-                    # Verifica se o caminho contém "mcp_server"
-                    if "mcp_server" not in diretorio.split(os.path.sep):
+                    diretorio = proc.cwd()
+
+                    # Verifica se o caminho contém "mcp_server" como componente
+                    if _MCP_DIR_MID not in diretorio and not diretorio.endswith(_MCP_DIR_END):
                         # Pula este processo se não estiver dentro de mcp_server
                         continue
                     
@@ -311,10 +378,10 @@ def identificar_servidores_mcp(processos):
                 # Verifica se usa transporte stdio
                 usando_stdio = False
                 for i, cmd in enumerate(cmdline):
-                    if cmd == 'transport=stdio' or cmd == '--transport=stdio' or cmd == '-t=stdio':
+                    if cmd in _STDIO_EQ:
                         usando_stdio = True
                         break
-                    if i+2 < len(cmdline) and (cmd == 'transport' or cmd == '--transport' or cmd == '-t') and cmdline[i+1] == 'stdio':
+                    if i+2 < len(cmdline) and cmd in _TRANSPORT_FLAGS and cmdline[i+1] == 'stdio':
                         usando_stdio = True
                         break
                 
@@ -326,66 +393,87 @@ def identificar_servidores_mcp(processos):
                 nome_completo = f"{nome_projeto}/{arquivo_python}"
                 
                 # Verifica se a porta está ativa
-                porta_ativa = verificar_porta_em_uso(porta)
+                if portas_em_escuta is not None:
+                    porta_ativa = porta in portas_em_escuta
+                else:
+                    # Sem permissão para o snapshot: recorre ao teste por socket
+                    porta_ativa = verificar_porta_em_uso(porta)
                 
                 # Define o tipo de atividade com base na porta e no modo de transporte
-                if porta_ativa:
-                    tipo_ativo = "http"  # Ativo via HTTP (porta)
-                elif usando_stdio:
-                    tipo_ativo = "stdio"  # Ativo via stdio (sem porta)
-                else:
-                    tipo_ativo = None  # Inativo
+                tipo_ativo = _TIPO_ATIVO[(porta_ativa << 1) | usando_stdio]
                 
                 # Adiciona à lista de servidores
                 servidor = {
                     'pid': proc.info['pid'],
-                    'ppid': proc.info.get('ppid', 0),  # Processo pai, se disponível
+                    '_proc': proc,  # Instância reutilizada nas ações (evita reabrir /proc/<pid>)
+                    'ppid': proc.ppid(),  # Processo pai, se disponível
                     'nome_projeto': nome_completo,
                     'nome_ambiente': nome_projeto,
                     'arquivo_python': arquivo_python,
                     'porta': porta,
                     'porta_ativa': porta_ativa,
                     'tipo_ativo': tipo_ativo,
-                    'tempo_execucao': time.time() - proc.info['create_time'],
-                    'diretorio': proc.info['cwd'],
-                    'comando': ' '.join(cmdline),
+                    'tempo_execucao': time.time() - proc.create_time(),
+                    'diretorio': diretorio,
+                    'cmdline': cmdline,
                     'processos_relacionados': [],  # Lista para armazenar PIDs de processos relacionados
                     'e_processo_pai': True,  # Assume inicialmente que é processo pai
                     'processo_pai_pid': None  # Será preenchido para processos filhos
                 }
                 
-                # Agrupa servidores pelo nome do arquivo para identificar processos relacionados
-                chave_agrupamento = f"{nome_projeto}_{arquivo_python}"
-                if chave_agrupamento not in grupos_servidores:
-                    grupos_servidores[chave_agrupamento] = []
-                grupos_servidores[chave_agrupamento].append(servidor)
-                
                 servidores_mcp.append(servidor)
         
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
     
-    # Segundo passo: identificar relações pai-filho e marcar os processos filhos
-    for i, servidor in enumerate(servidores_mcp):
-        pid = servidor['pid']
-        ppid = servidor['ppid']
-        
-        # Verifica se este processo é filho de outro processo MCP
-        for outro_servidor in servidores_mcp:
-            if outro_servidor['pid'] == ppid:
-                # Este é um processo filho
-                processos_filhos.add(pid)
-                servidor['e_processo_pai'] = False
-                servidor['processo_pai_pid'] = ppid
-                
-                # Adiciona à lista de processos relacionados do pai
-                outro_servidor['processos_relacionados'].append(pid)
+    # Segundo passo: identificar relações pai-filho e marcar os processos filhos.
+    # Indexa por PID para fazer a ligação em O(N) em vez do par de loops O(N²)
+    por_pid = {s['pid']: s for s in servidores_mcp}
+    for servidor in servidores_mcp:
+        pai = por_pid.get(servidor['ppid'])
+        if pai is not None:
+            # Este é um processo filho
+            processos_filhos.add(servidor['pid'])
+            servidor['e_processo_pai'] = False
+            servidor['processo_pai_pid'] = servidor['ppid']
+
+            # Adiciona à lista de processos relacionados do pai
+            pai['processos_relacionados'].append(servidor['pid'])
     
     # Terceiro passo: filtrar apenas os processos pai
     servidores_filtrados = [s for s in servidores_mcp if s['e_processo_pai']]
     
     return servidores_filtrados
 
+# Cache com TTL das informações que o menu exibe; navegar pelo menu não
+# precisa refazer a varredura de processos e o parse das configurações
+_MENU_TTL = 2.0
+_menu_cache = {}
+
+def get_configs(force=False):
+    """Retorna as configurações, reaproveitando o resultado por alguns segundos."""
+    agora = time.monotonic()
+    entrada = _menu_cache.get("configs")
+    if not force and entrada is not None and agora - entrada[0] < _MENU_TTL:
+        return entrada[1]
+    configs = carregar_configuracoes()
+    _menu_cache["configs"] = (agora, configs)
+    return configs
+
+def get_servidores_mcp(force=False):
+    """Retorna os servidores MCP ativos, reaproveitando a varredura por alguns segundos."""
+    agora = time.monotonic()
+    entrada = _menu_cache.get("mcp")
+    if not force and entrada is not None and agora - entrada[0] < _MENU_TTL:
+        return entrada[1]
+    servidores = identificar_servidores_mcp(obter_processos_python())
+    _menu_cache["mcp"] = (agora, servidores)
+    return servidores
+
+def invalidar_cache():
+    """Descarta o cache do menu após ações que alteram processos ou configurações."""
+    _menu_cache.clear()
+
 def formatar_tempo(segundos):
     """Formata o tempo em segundos para um formato legível."""
     if segundos < 60:
@@ -544,7 +632,7 @@ def iniciar_servidor(configs):
         console.print(f"[green]Executando:[/green] {comando_str}")
         
         # Executa o servidor em background
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # No Windows, usa startupinfo para esconder a janela do console
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -568,12 +656,19 @@ def reiniciar_servidor(servidores_mcp):
         console.print("[yellow]Nenhum servidor MCP ativo no momento.[/yellow]")
         return
     
-    # Lista os servidores disponíveis
-    console.print("[bold]Servidores ativos:[/bold]")
+    # Lista os servidores disponíveis em uma única tabela (um único render do Rich)
+    tabela = Table(title="Servidores ativos", show_header=True, header_style="bold")
+    tabela.add_column("#", style="cyan")
+    tabela.add_column("Servidor", style="green")
+    tabela.add_column("PID", style="magenta")
+    tabela.add_column("Status", style="yellow")
+
     for i, servidor in enumerate(servidores_mcp, 1):
-        status = "HTTP" if servidor['tipo_ativo'] == 'http' else "STDIO" if servidor['tipo_ativo'] == 'stdio' else "INATIVO"
-        console.print(f"[cyan]{i}.[/cyan] {servidor['nome_ambiente']}/{servidor['arquivo_python']} (PID: {servidor['pid']}, Status: {status})")
-    
+        status = _TIPO_DISPLAY[servidor['tipo_ativo']]
+        tabela.add_row(str(i), f"{servidor['nome_ambiente']}/{servidor['arquivo_python']}", str(servidor['pid']), status)
+
+    console.print(tabela)
+
     # Solicita ao usuário que escolha um servidor
     escolha = input("\nEscolha um servidor para reiniciar pelo número (ou 'q' para cancelar): ")
     if escolha.lower() == 'q':
@@ -589,21 +684,25 @@ def reiniciar_servidor(servidores_mcp):
         
         # Encerra o processo
         try:
-            processo = psutil.Process(servidor['pid'])
+            processo = servidor.get('_proc') or psutil.Process(servidor['pid'])
             processo.terminate()
             
             console.print(f"[yellow]Encerrando processo {servidor['pid']}...[/yellow]")
-            
-            # Aguarda o processo encerrar
-            gone, alive = psutil.wait_procs([processo], timeout=3)
-            if processo in alive:
+
+            # Aguarda o processo encerrar (wait direto: sem as listas
+            # gone/alive que wait_procs monta para um único processo)
+            try:
+                processo.wait(timeout=3)
+            except psutil.TimeoutExpired:
                 processo.kill()
                 console.print(f"[yellow]Processo não respondeu, forçando encerramento...[/yellow]")
-            
+                processo.wait(timeout=1)
+
             console.print(f"[green]Processo {servidor['pid']} encerrado.[/green]")
             
-            # Extrai o comando original
-            comando = servidor['comando'].split()
+            # Reutiliza a linha de comando original já em forma de lista;
+            # um split() da string quebraria caminhos com espaços
+            comando = servidor['cmdline']
             if not comando:
                 console.print("[red]Não foi possível extrair o comando original.[/red]")
                 return
@@ -612,7 +711,7 @@ def reiniciar_servidor(servidores_mcp):
             console.print("[green]Reiniciando servidor...[/green]")
             
             # Executa o servidor em background
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # No Windows, usa startupinfo para esconder a janela do console
                 startupinfo = subprocess.STARTUPINFO()
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -641,12 +740,19 @@ def encerrar_servidor(servidores_mcp):
         console.print("[yellow]Nenhum servidor MCP ativo no momento.[/yellow]")
         return
     
-    # Lista os servidores disponíveis
-    console.print("[bold]Servidores ativos:[/bold]")
+    # Lista os servidores disponíveis em uma única tabela (um único render do Rich)
+    tabela = Table(title="Servidores ativos", show_header=True, header_style="bold")
+    tabela.add_column("#", style="cyan")
+    tabela.add_column("Servidor", style="green")
+    tabela.add_column("PID", style="magenta")
+    tabela.add_column("Status", style="yellow")
+
     for i, servidor in enumerate(servidores_mcp, 1):
-        status = "HTTP" if servidor['tipo_ativo'] == 'http' else "STDIO" if servidor['tipo_ativo'] == 'stdio' else "INATIVO"
-        console.print(f"[cyan]{i}.[/cyan] {servidor['nome_ambiente']}/{servidor['arquivo_python']} (PID: {servidor['pid']}, Status: {status})")
-    
+        status = _TIPO_DISPLAY[servidor['tipo_ativo']]
+        tabela.add_row(str(i), f"{servidor['nome_ambiente']}/{servidor['arquivo_python']}", str(servidor['pid']), status)
+
+    console.print(tabela)
+
     # Solicita ao usuário que escolha um servidor
     escolha = input("\nEscolha um servidor para encerrar pelo número (ou 'q' para cancelar): ")
     if escolha.lower() == 'q':
@@ -662,17 +768,20 @@ def encerrar_servidor(servidores_mcp):
         
         # Encerra o processo
         try:
-            processo = psutil.Process(servidor['pid'])
+            processo = servidor.get('_proc') or psutil.Process(servidor['pid'])
             console.print(f"[yellow]Encerrando processo {servidor['pid']}...[/yellow]")
             
             processo.terminate()
-            
-            # Aguarda o processo encerrar
-            gone, alive = psutil.wait_procs([processo], timeout=3)
-            if processo in alive:
+
+            # Aguarda o processo encerrar (wait direto: sem as listas
+            # gone/alive que wait_procs monta para um único processo)
+            try:
+                processo.wait(timeout=3)
+            except psutil.TimeoutExpired:
                 processo.kill()
                 console.print(f"[yellow]Processo não respondeu, forçando encerramento...[/yellow]")
-            
+                processo.wait(timeout=1)
+
             console.print(f"[bold green]✓[/bold green] Servidor {servidor['nome_ambiente']}/{servidor['arquivo_python']} encerrado com sucesso!")
             
         except psutil.NoSuchProcess:
@@ -685,41 +794,143 @@ def encerrar_servidor(servidores_mcp):
     except ValueError:
         console.print("[yellow]Escolha inválida. Digite um número.[/yellow]")
 
+def _aguardar_processos(processos, timeout):
+    """Aguarda vários processos encerrarem dentro de uma única janela de timeout.
+
+    No Linux usa os.pidfd_open + select.poll (espera orientada a eventos, sem
+    busy-wait); em outros sistemas espera cada processo em uma thread.
+    Retorna a lista dos processos ainda vivos ao final da janela.
+    """
+    if not processos:
+        return []
+
+    fds = {}
+    try:
+        poller = select.poll()
+        for processo in processos:
+            fd = os.pidfd_open(processo.pid)
+            fds[fd] = processo
+            poller.register(fd, select.POLLIN)
+    except (AttributeError, OSError):
+        # pidfd indisponível (Windows/macOS, kernel antigo ou processo já
+        # finalizado): espera cada processo em uma thread para sobrepor as
+        # janelas de timeout em vez de somá-las em série. Import adiado:
+        # só paga o custo de concurrent.futures quem cai neste caminho
+        from concurrent.futures import ThreadPoolExecutor
+
+        for fd in fds:
+            os.close(fd)
+
+        def _esperar(processo):
+            try:
+                processo.wait(timeout=timeout)
+                return None
+            except psutil.TimeoutExpired:
+                return processo
+            except psutil.Error:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(processos))) as executor:
+            return [p for p in executor.map(_esperar, processos) if p is not None]
+
+    try:
+        prazo = time.monotonic() + timeout
+        vivos = dict(fds)
+        while vivos:
+            restante_ms = (prazo - time.monotonic()) * 1000
+            if restante_ms <= 0:
+                break
+            for fd, _evento in poller.poll(restante_ms):
+                poller.unregister(fd)
+                vivos.pop(fd, None)
+        return list(vivos.values())
+    finally:
+        for fd in fds:
+            os.close(fd)
+
 def encerrar_todos_servidores(servidores_mcp):
     """Encerra todos os servidores MCP ativos."""
     cabecalho("ENCERRAR TODOS OS SERVIDORES MCP")
-    
+
     if not servidores_mcp:
         console.print("[yellow]Nenhum servidor MCP ativo no momento.[/yellow]")
         return
-    
+
     console.print(f"[bold yellow]Encerrando {len(servidores_mcp)} servidores MCP...[/bold yellow]")
-    
+
     encerrados = 0
     falhas = 0
-    
+
+    # Com MCP_FORCE_KILL=1 o período de cortesia do SIGTERM é pulado e o
+    # kill é enviado direto — servidores MCP normalmente não tratam SIGTERM,
+    # então morrem igual, só que sem a janela de 2 segundos
+    forcar = bool(os.environ.get("MCP_FORCE_KILL"))
+
+    # Fase 1: envia o sinal a todos os servidores de uma só vez; as mensagens
+    # são acumuladas e emitidas em lote depois, fora do laço quente
+    pendentes = []
+    erros = []
     for servidor in servidores_mcp:
         try:
-            processo = psutil.Process(servidor['pid'])
-            processo.terminate()
-            
-            # Aguarda o processo encerrar
-            gone, alive = psutil.wait_procs([processo], timeout=2)
-            if processo in alive:
+            # Sondagem barata de vida (um syscall) antes de construir o
+            # psutil.Process de uma entrada possivelmente obsoleta; só em
+            # POSIX — no Windows os.kill com sinal 0 mataria o processo
+            if not _IS_WINDOWS:
+                try:
+                    os.kill(servidor['pid'], 0)
+                except ProcessLookupError:
+                    raise psutil.NoSuchProcess(servidor['pid'])
+                except PermissionError:
+                    pass  # Sem permissão de sinal, mas o processo está vivo
+
+            processo = servidor.get('_proc') or psutil.Process(servidor['pid'])
+            if forcar:
                 processo.kill()
-            
-            encerrados += 1
-            console.print(f"[green]✓ Processo {servidor['pid']} ({servidor['nome_ambiente']}/{servidor['arquivo_python']}) encerrado.[/green]")
-            
+            else:
+                processo.terminate()
+            pendentes.append((servidor, processo))
         except psutil.NoSuchProcess:
-            console.print(f"[yellow]Processo {servidor['pid']} não encontrado.[/yellow]")
+            erros.append((servidor['pid'], "não encontrado"))
             falhas += 1
         except psutil.AccessDenied:
-            console.print(f"[red]Acesso negado ao encerrar processo {servidor['pid']}.[/red]")
+            erros.append((servidor['pid'], "acesso negado"))
             falhas += 1
         except Exception as e:
-            console.print(f"[red]Erro ao encerrar processo {servidor['pid']}: {str(e)}[/red]")
+            erros.append((servidor['pid'], str(e)))
             falhas += 1
+
+    # Fase 2: aguarda todos em paralelo numa única janela de espera
+    vivos = _aguardar_processos([processo for _, processo in pendentes],
+                                timeout=1 if forcar else 2)
+
+    # Fase 3: força o encerramento dos que não responderam
+    if vivos:
+        for processo in vivos:
+            try:
+                processo.kill()
+            except psutil.Error:
+                pass
+        _aguardar_processos(vivos, timeout=1)
+
+    # Saída em lote: uma grade para os encerrados e outra para as falhas,
+    # em vez de um console.print por processo
+    if pendentes:
+        grade = Table.grid(padding=(0, 1))
+        for servidor, _processo in pendentes:
+            encerrados += 1
+            # Extrai os valores uma única vez, sem repetir os hashes do dict
+            pid = servidor['pid']
+            ambiente = servidor['nome_ambiente']
+            arquivo = servidor['arquivo_python']
+            grade.add_row("[green]✓[/green]",
+                          f"[green]Processo {pid} ({ambiente}/{arquivo}) encerrado.[/green]")
+        console.print(grade)
+
+    if erros:
+        grade = Table.grid(padding=(0, 1))
+        for pid, mensagem in erros:
+            grade.add_row("[red]✗[/red]", f"[red]Processo {pid}: {mensagem}[/red]")
+        console.print(grade)
     
     if encerrados > 0:
         console.print(f"\n[bold green]✓ {encerrados} servidor(es) encerrado(s) com sucesso![/bold green]")
@@ -729,39 +940,32 @@ def encerrar_todos_servidores(servidores_mcp):
 
 def mostrar_animacao_carregamento(duracao=2, simbolos=".:", mensagem="Carregando menu"):
     """Mostra uma animação de carregamento simples por um determinado tempo."""
-    import sys
-    import time
-    
+    # Sem terminal interativo (ou com MCP_NO_ANIM definido) a animação é
+    # só atraso cosmético: pula direto
+    if not sys.stdout.isatty() or os.environ.get("MCP_NO_ANIM"):
+        return
+
     # Número de caracteres para a animação
     comprimento_max = 15
-    
+
     try:
-        # Desabilita o buffer de saída para que a animação apareça em tempo real
-        sys.stdout.flush()
-        
-        # Loop de animação até o tempo especificado
-        inicio = time.time()
-        i = 0
-        while time.time() - inicio < duracao:
+        # Passos pré-calculados: o laço não precisa consultar o relógio
+        passos = int(duracao / 0.1)
+        for i in range(passos):
             # Alterna entre os símbolos
             char = simbolos[i % len(simbolos)]
-            
-            # Calcula a quantidade de caracteres com base no tempo decorrido
-            progresso = min(int((time.time() - inicio) / duracao * comprimento_max), comprimento_max)
-            
-            # Constrói a string de animação
-            barra = char * progresso
-            
+
+            # Calcula a quantidade de caracteres com base no passo atual
+            progresso = min(int((i + 1) / passos * comprimento_max), comprimento_max)
+
             # Imprime a mensagem e a barra de progresso
-            print(f"\r{mensagem} {barra}", end='', flush=True)
-            
-            # Incrementa o contador e aguarda
-            i += 1
+            print(f"\r{mensagem} {char * progresso}", end='', flush=True)
+
             time.sleep(0.1)
-        
+
         # Limpa a linha ao finalizar
         print("\r" + " " * (len(mensagem) + comprimento_max + 1) + "\r", end='', flush=True)
-    
+
     except Exception as e:
         # Em caso de erro, simplesmente finaliza sem mostrar erro
         pass
@@ -770,27 +974,27 @@ def remover_servidor_configurado(configs):
     """Remove um servidor da configuração dos arquivos JSON dos clientes."""
     cabecalho("REMOVER SERVIDOR CONFIGURADO")
     
-    # Combina todos os servidores disponíveis
-    servidores_disponiveis = {}
-    
+    # Combina todos os servidores disponíveis em uma lista plana de tuplas
+    # (nome, origem, config, caminho_config) — sem dicts aninhados por linha
+    # nem list(d.keys()) a cada escolha
+    servidores_disponiveis = []
+
     for cliente, config in configs.items():
         if config["status"] == "carregado":
             for nome, servidor in config["servidores"].items():
-                servidores_disponiveis[f"{nome}_{cliente}"] = {
-                    "nome": nome,
-                    "origem": cliente,
-                    "config": servidor,
-                    "caminho_config": config["caminho"]
-                }
-    
+                servidores_disponiveis.append((nome, cliente, servidor, config["caminho"]))
+
     if not servidores_disponiveis:
         console.print("[yellow]Nenhuma configuração de servidor encontrada.[/yellow]")
         return
-    
-    # Lista os servidores disponíveis
+
+    # Lista os servidores disponíveis em um único render (uma grade do Rich
+    # em vez de um console.print por linha)
     console.print("[bold]Servidores disponíveis para remoção:[/bold]")
-    for i, (chave, info) in enumerate(servidores_disponiveis.items(), 1):
-        console.print(f"[cyan]{i}.[/cyan] {info['nome']} [dim]({info['origem']})[/dim]")
+    grade = Table.grid(padding=(0, 1))
+    for i, (nome, origem, _, _) in enumerate(servidores_disponiveis, 1):
+        grade.add_row(f"[cyan]{i}.[/cyan]", nome, f"[dim]({origem})[/dim]")
+    console.print(grade)
     
     # Solicita ao usuário que escolha um servidor
     escolha = input("\nEscolha um servidor pelo número (ou 'q' para cancelar): ")
@@ -803,12 +1007,8 @@ def remover_servidor_configurado(configs):
             console.print("[yellow]Escolha inválida.[/yellow]")
             return
         
-        # Obtém o nome e configuração do servidor escolhido
-        chave_servidor = list(servidores_disponiveis.keys())[idx]
-        info_servidor = servidores_disponiveis[chave_servidor]
-        nome_servidor = info_servidor["nome"]
-        cliente_origem = info_servidor["origem"]
-        caminho_config = info_servidor["caminho_config"]
+        # Obtém o nome e configuração do servidor escolhido (indexação direta)
+        nome_servidor, cliente_origem, _, caminho_config = servidores_disponiveis[idx]
         
         # Confirma a remoção
         confirmar = input(f"\nTem certeza que deseja remover o servidor '{nome_servidor}' ({cliente_origem})? (s/n): ")
@@ -818,17 +1018,29 @@ def remover_servidor_configurado(configs):
         
         # Remove o servidor do arquivo de configuração
         try:
-            # Carrega o arquivo de configuração
-            with open(caminho_config, 'r', encoding='utf-8') as f:
-                dados_config = json.load(f)
-            
+            # Carrega o arquivo de configuração (bytes direto para o decoder)
+            dados_config = _loads(Path(caminho_config).read_bytes())
+
             # Remove o servidor da configuração
             if 'mcpServers' in dados_config and nome_servidor in dados_config['mcpServers']:
                 del dados_config['mcpServers'][nome_servidor]
-                
-                # Salva o arquivo de configuração atualizado
-                with open(caminho_config, 'w', encoding='utf-8') as f:
-                    json.dump(dados_config, f, indent=2)
+
+                # Salva o arquivo de configuração atualizado de forma atômica:
+                # escreve em um temporário e troca com os.replace, para nunca
+                # deixar o arquivo truncado se o processo morrer no meio
+                tmp = caminho_config + ".tmp"
+                try:
+                    with open(tmp, 'wb') as f:
+                        f.write(_dumps(dados_config))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp, caminho_config)
+                except Exception:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                    raise
                 
                 console.print(f"[green]✓ Servidor '{nome_servidor}' removido da configuração do {cliente_origem}.[/green]")
             else:
@@ -842,23 +1054,96 @@ def remover_servidor_configurado(configs):
     except Exception as e:
         console.print(f"[bold red]Erro ao remover o servidor:[/bold red] {str(e)}")
 
+# Opções do menu principal: texto estático, montado uma única vez e
+# impresso em uma só chamada (um único parse de markup e um único write)
+_MENU_OPCOES = "\n".join([
+    "[bold cyan]Opções disponíveis:[/bold cyan]\n",
+    "1. [green]Listar servidores configurados[/green] (Cursor e Claude Desktop)",
+    "2. [green]Listar servidores ativos[/green] (Processos em execução)",
+    "3. [cyan]Iniciar servidor[/cyan] (A partir da configuração)",
+    "4. [cyan]Reiniciar servidor[/cyan] (Encerrar e iniciar novamente)",
+    "5. [yellow]Encerrar servidor específico[/yellow]",
+    "6. [red]Encerrar todos os servidores[/red]",
+    "7. [red]Remover servidor configurado[/red] (Exclui dos arquivos de configuração)",
+    "8. [blue]Adicionar servidor MCP[/blue] (Cria um novo servidor)",
+    "0. [bold]Sair[/bold]\n",
+])
+
 def mostrar_menu():
     """Mostra o menu principal do launcher."""
     cabecalho("LAUNCHER MCP")
-    
-    console.print("[bold cyan]Opções disponíveis:[/bold cyan]\n")
-    console.print("1. [green]Listar servidores configurados[/green] (Cursor e Claude Desktop)")
-    console.print("2. [green]Listar servidores ativos[/green] (Processos em execução)")
-    console.print("3. [cyan]Iniciar servidor[/cyan] (A partir da configuração)")
-    console.print("4. [cyan]Reiniciar servidor[/cyan] (Encerrar e iniciar novamente)")
-    console.print("5. [yellow]Encerrar servidor específico[/yellow]")
-    console.print("6. [red]Encerrar todos os servidores[/red]")
-    console.print("7. [red]Remover servidor configurado[/red] (Exclui dos arquivos de configuração)")
-    console.print("8. [blue]Adicionar servidor MCP[/blue] (Cria um novo servidor)")
-    console.print("0. [bold]Sair[/bold]\n")
-    
-    opcao = input("Escolha uma opção: ")
-    return opcao
+
+    console.print(_MENU_OPCOES)
+
+    # Sem terminal não há o que perguntar: encerra o launcher
+    if not _ISATTY:
+        return '0'
+
+    sys.stdout.write("Escolha uma opção: ")
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+def _menu_listar_configurados(configs, servidores_mcp):
+    total = listar_servidores_configurados(configs)
+    print(f"\nTotal: {total} servidores configurados")
+    pausar()
+
+def _menu_listar_ativos(configs, servidores_mcp):
+    total = listar_servidores_ativos(servidores_mcp)
+    print(f"\nTotal: {total} servidores ativos")
+    pausar()
+
+def _menu_iniciar(configs, servidores_mcp):
+    iniciar_servidor(configs)
+    invalidar_cache()
+    pausar()
+
+def _menu_reiniciar(configs, servidores_mcp):
+    reiniciar_servidor(servidores_mcp)
+    invalidar_cache()
+    pausar()
+
+def _menu_encerrar(configs, servidores_mcp):
+    encerrar_servidor(servidores_mcp)
+    invalidar_cache()
+    pausar()
+
+def _menu_encerrar_todos(configs, servidores_mcp):
+    encerrar_todos_servidores(servidores_mcp)
+    invalidar_cache()
+    pausar()
+
+def _menu_remover(configs, servidores_mcp):
+    remover_servidor_configurado(configs)
+    invalidar_cache()
+    pausar()
+
+def _menu_adicionar(configs, servidores_mcp):
+    cabecalho("ADICIONAR SERVIDOR MCP")
+    _dim("Iniciando utilitário para adicionar servidor MCP...")
+    try:
+        # Chamar o script add_mcp.py
+        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "add_mcp.py")
+        subprocess.run([sys.executable, script_path], check=True)
+        console.print("[green]✓ Utilitário de adição de servidor MCP concluído.[/green]")
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]Erro ao executar o utilitário: {str(e)}[/red]")
+    except Exception as e:
+        console.print(f"[red]Erro inesperado: {str(e)}[/red]")
+    invalidar_cache()
+    pausar()
+
+# Tabela de despacho do menu, montada uma única vez: opção -> handler
+_HANDLERS = {
+    '1': _menu_listar_configurados,
+    '2': _menu_listar_ativos,
+    '3': _menu_iniciar,
+    '4': _menu_reiniciar,
+    '5': _menu_encerrar,
+    '6': _menu_encerrar_todos,
+    '7': _menu_remover,
+    '8': _menu_adicionar,
+}
 
 def main():
     """Função principal do launcher."""
@@ -872,64 +1157,21 @@ def main():
         
         while True:
             # Cada vez que o menu é exibido, atualiza as informações
-            configs = carregar_configuracoes()
-            processos_python = obter_processos_python()
-            servidores_mcp = identificar_servidores_mcp(processos_python)
-            
+            # (com cache curto: só revarre quando o TTL expira ou após ações)
+            configs = get_configs()
+            servidores_mcp = get_servidores_mcp()
+
             opcao = mostrar_menu()
-            
-            if opcao == '1':
-                total = listar_servidores_configurados(configs)
-                print(f"\nTotal: {total} servidores configurados")
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '2':
-                total = listar_servidores_ativos(servidores_mcp)
-                print(f"\nTotal: {total} servidores ativos")
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '3':
-                iniciar_servidor(configs)
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '4':
-                reiniciar_servidor(servidores_mcp)
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '5':
-                encerrar_servidor(servidores_mcp)
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '6':
-                encerrar_todos_servidores(servidores_mcp)
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '7':
-                remover_servidor_configurado(configs)
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '8':
-                cabecalho("ADICIONAR SERVIDOR MCP")
-                console.print("[dim]Iniciando utilitário para adicionar servidor MCP...[/dim]")
-                try:
-                    # Chamar o script add_mcp.py
-                    script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "add_mcp.py")
-                    if platform.system() == "Windows":
-                        subprocess.run([sys.executable, script_path], check=True)
-                    else:
-                        subprocess.run([sys.executable, script_path], check=True)
-                    console.print("[green]✓ Utilitário de adição de servidor MCP concluído.[/green]")
-                except subprocess.CalledProcessError as e:
-                    console.print(f"[red]Erro ao executar o utilitário: {str(e)}[/red]")
-                except Exception as e:
-                    console.print(f"[red]Erro inesperado: {str(e)}[/red]")
-                input("\nPressione ENTER para continuar...")
-                
-            elif opcao == '0':
+
+            if opcao == '0':
                 cabecalho("ATÉ LOGO!")
                 console.print("[green]Obrigado por usar o MCP Launcher![/green]")
                 break
-                
+
+            # Despacho direto pela tabela, sem cascata de elif
+            acao = _HANDLERS.get(opcao)
+            if acao is not None:
+                acao(configs, servidores_mcp)
             else:
                 console.print("[yellow]Opção inválida. Por favor, tente novamente.[/yellow]")
                 time.sleep(1)
@@ -939,7 +1181,7 @@ def main():
     except Exception as e:
         console.print(f"\n[bold red]Erro não esperado:[/bold red] {str(e)}")
     
-    console.print("[dim]Encerrando...[/dim]")
+    _dim("Encerrando...")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
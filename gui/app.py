@@ -7,19 +7,106 @@ para a interface gráfica.
 import os
 import sys
 import tkinter as tk
-import subprocess
 import threading
 import time
-import platform
+import queue
 import json
-from tkinter import ttk, filedialog, messagebox
+import pickle
+import importlib.util
+import functools
+from collections import deque
+from tkinter import ttk, messagebox
 from pathlib import Path
-from datetime import datetime
-import re
 import psutil
 
+# subprocess, re, datetime e filedialog são importados localmente nas funções
+# que os usam (caminhos raros como quick setup e exportação de logs); mantê-los
+# fora do cabeçalho tira esses módulos do caminho de inicialização
+
+# Caminhos do projeto resolvidos uma única vez no import (cada
+# Path(__file__).resolve() refaz um realpath no sistema de arquivos)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_DIR = str(PROJECT_ROOT)
+ICON_PATH = PROJECT_ROOT / "gui" / "assets" / "icon.ico"
+CONFIG_FILE = os.path.join(PROJECT_DIR, "config", "app_config.json")
+MCP_SERVER_DIR = os.path.join(PROJECT_DIR, "mcp_server")
+
 # Adiciona o diretório raiz ao sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, PROJECT_DIR)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_uv_path():
+    """
+    Localiza o executável do uv (where.exe no Windows, which no Unix,
+    com fallback para caminhos comuns de instalação).
+
+    O resultado é memoizado com lru_cache: o caminho do uv não muda
+    durante a execução e cada busca dispara um subprocesso.
+
+    Returns:
+        str: Caminho do executável uv
+
+    Raises:
+        Exception: Se o executável não for encontrado
+    """
+    import shutil
+
+    # shutil.which percorre o PATH dentro do processo, sem o custo (e o
+    # flash de console no Windows) de disparar where.exe/which
+    uv_path = shutil.which("uv.exe") or shutil.which("uv") or ""
+    if uv_path:
+        return uv_path
+
+    if os.name == 'nt':  # Windows
+        # Fallback: where.exe (ferramenta padrão do Windows), sem janela
+        # de console e sem herdar o stdin
+        import subprocess
+
+        result = subprocess.run(
+            ["where.exe", "uv.exe"],
+            capture_output=True,
+            text=True,
+            check=False,
+            stdin=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+
+        if result.returncode == 0 and result.stdout.strip():
+            # Pegar a primeira linha do resultado (primeiro caminho encontrado)
+            uv_path = result.stdout.strip().split('\n')[0]
+        else:
+            # Se não encontrar, tentar encontrar em caminhos comuns
+            common_paths = [
+                os.path.expanduser("~/.local/bin/uv.exe"),
+                os.path.expanduser("~/AppData/Local/Programs/Python/Python312/Scripts/uv.exe"),
+                os.path.expanduser("~/pipx/venvs/uv/Scripts/uv.exe"),
+                "C:\\Users\\JAMILE\\pipx\\venvs\\uv\\Scripts\\uv.exe"
+            ]
+
+            for path in common_paths:
+                if os.path.exists(path):
+                    uv_path = path
+                    break
+
+        if not uv_path:
+            raise Exception("Não foi possível encontrar o executável uv.exe")
+    else:  # Linux/macOS
+        # Fallback: caminhos comuns de instalação no Unix
+        common_paths = [
+            os.path.expanduser("~/.local/bin/uv"),
+            "/usr/local/bin/uv"
+        ]
+
+        for path in common_paths:
+            if os.path.exists(path):
+                uv_path = path
+                break
+
+        if not uv_path:
+            raise Exception("Não foi possível encontrar o executável uv")
+
+    return uv_path
 
 # Importa utilitários da GUI
 from gui.utils import (
@@ -42,6 +129,54 @@ from gui.config_manager import ConfigManager
 # Importa utilitário de configuração
 from cli import config_util
 
+
+# Template básico de servidor MCP gerado para novos servidores; definido
+# uma única vez no módulo (com placeholders de str.format) em vez de
+# reconstruir a f-string inteira a cada criação de servidor
+_MCP_TEMPLATE = '''"""
+Servidor MCP: {name}
+Arquivo: {file_name}.py
+
+Este servidor MCP foi gerado automaticamente pelo MCP Server Manager.
+"""
+from typing import Any
+from mcp.server.fastmcp import FastMCP
+
+# Inicializa o servidor FastMCP
+mcp = FastMCP("{name}", log_level="ERROR")
+
+@mcp.tool()
+async def hello(name: str = "Mundo") -> str:
+    """Retorna uma saudação personalizada.
+    
+    Args:
+        name: O nome para saudar. Padrão: "Mundo"
+        
+    Returns:
+        Uma mensagem de saudação personalizada
+    """
+    return f"Olá {{name}} do servidor {name}!"
+
+@mcp.tool()
+async def soma(a: float, b: float) -> float:
+    """Soma dois números.
+    
+    Args:
+        a: Primeiro número
+        b: Segundo número
+        
+    Returns:
+        A soma dos dois números
+    """
+    return a + b
+
+if __name__ == "__main__":
+    # Inicializa e executa o servidor
+    print("Iniciando o servidor MCP {name}...")
+    print("Use Ctrl+C para encerrar.")
+    mcp.run(transport='stdio')
+'''
+
 class MCPServerGUI(tk.Tk):
     """Classe principal da aplicação GUI para o MCP Server."""
     
@@ -54,18 +189,25 @@ class MCPServerGUI(tk.Tk):
         self.minsize(800, 600)
         
         # Definir ícone da aplicação (se existir)
-        icon_path = Path(__file__).resolve().parent / "assets" / "icon.ico"
-        if icon_path.exists():
-            self.iconbitmap(str(icon_path))
-        
-        # Centralizar a janela
-        center_window(self, 1024, 768)
+        if ICON_PATH.exists():
+            self.iconbitmap(str(ICON_PATH))
         
-        # Maximizar a janela ao iniciar
-        if os.name == 'nt':  # Windows
+        # Cache de diálogos reutilizáveis (criados uma única vez e depois
+        # escondidos/reexibidos em vez de reconstruídos)
+        self._dialogs = {}
+
+        # Maximizar a janela ao iniciar; só centralizar quando não for
+        # maximizar (o gerenciador de janelas ignoraria a geometria) ou no
+        # macOS, onde o atributo -zoomed não existe e levantaria TclError
+        if sys.platform == 'darwin':  # macOS
+            center_window(self, 1024, 768)
+        elif os.name == 'nt':  # Windows
             self.state('zoomed')
-        else:  # Linux/macOS
-            self.attributes('-zoomed', True)
+        else:  # Linux
+            try:
+                self.attributes('-zoomed', True)
+            except tk.TclError:
+                center_window(self, 1024, 768)
         
         # Verificar se o ambiente virtual está configurado
         if not self.check_venv_exists():
@@ -77,45 +219,92 @@ class MCPServerGUI(tk.Tk):
         self._init_application()
     
     def _init_application(self):
-        """Inicializa o restante da aplicação após verificação do ambiente."""
-        # Inicializar gerenciador de servidores
-        self.server_manager = ServerManager()
-        
-        # Registrar callbacks de eventos
-        self.server_manager.on_server_status_changed = self.on_server_status_changed
-        self.server_manager.on_log_added = self.on_log_added
-        
-        # Carregar configurações
+        """Monta a interface e agenda a inicialização do backend.
+
+        Apenas a casca visual é construída aqui; carregar servidores e
+        iniciar as threads de verificação fica para _init_backend, agendado
+        com after_idle para depois do primeiro desenho da janela.
+        """
+        # Carregar configurações (necessárias para aplicar o tema)
         self._load_app_config()
-        
+
         # Configurar estilos e tema
         self.style = apply_default_styles(self)
         self._apply_theme_from_config()
-        
+
         # Criar o menu principal
         self.create_menu()
-        
+
         # Criar a estrutura principal da interface
         self.create_main_frame()
-        
+
         # Configurar o gerenciador de abas
         self.create_notebook()
-        
-        # Carregar inicialmente a lista de servidores (sem verificar status)
-        self.populate_servers_list()
-        
+
+        # Evento de parada do verificador de status; criado antes do handler
+        # de fechamento para on_closing poder sinalizá-lo a qualquer momento
+        self._stop_evt = threading.Event()
+
+        # Flag de refresh pendente: garante no máximo um refresh_servers
+        # agendado/em andamento por vez (descarta ticks redundantes)
+        self._refresh_pending = False
+
+        # Cache das linhas renderizadas na árvore de servidores, usado pelo
+        # diff incremental de _refresh_servers_tree
+        self._tree_row_cache = {}
+
+        # Servidores com status alterado aguardando aplicação na interface;
+        # o flush agendado coalesce rajadas de callbacks em uma renderização
+        self._dirty_servers = set()
+        self._flush_scheduled = False
+
+        # Nomes dos servidores em execução; recalculado ao popular a lista
+        # e mantido incrementalmente pelas mudanças de status
+        self._running_names = set()
+
+        # Buffer de mensagens de log pendentes; descarregado em lote no
+        # widget de texto a cada 50ms para evitar um insert/see por mensagem
+        self._log_buffer = deque()
+        self._log_flush_scheduled = False
+
         # Configurar manipuladores de eventos
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
-        
+
+        # Feedback imediato enquanto o backend não termina de carregar
+        self.update_status("Carregando servidores...")
+
+        # Inicialização do backend adiada para depois do primeiro paint
+        self.after_idle(self._init_backend)
+
+    def _init_backend(self):
+        """Inicializa o gerenciador de servidores e as verificações em background."""
+        # Inicializar gerenciador de servidores
+        self.server_manager = ServerManager()
+
+        # Registrar callbacks de eventos
+        self.server_manager.on_server_status_changed = self.on_server_status_changed
+        self.server_manager.on_log_added = self.on_log_added
+
+        # Carregar inicialmente a lista de servidores (sem verificar status)
+        self.populate_servers_list()
+
         # Atualizar contadores
         self.update_server_count()
-        
-        # Programar a verificação de processos duplicados para acontecer 
+
+        # Programar a verificação de processos duplicados para acontecer
         # após um pequeno atraso para dar tempo da interface carregar completamente
         self.after(3000, self.check_for_duplicate_processes)
-        
-        # Iniciar o verificador de status em background
-        self.should_check_status = True
+
+        # Pool pequeno para as sondas de status (reutiliza threads em vez de
+        # criar uma nova a cada refresh) e fila para devolver os resultados
+        # à thread da interface
+        from concurrent.futures import ThreadPoolExecutor
+        self._probe_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mcp-probe")
+        self._ui_queue = queue.Queue()
+        self.after(100, self._drain_ui_queue)
+
+        # Iniciar o verificador de status em background (o _stop_evt permite
+        # acordar a thread imediatamente no encerramento da aplicação)
         self.status_check_thread = threading.Thread(target=self._background_status_checker, daemon=True)
         self.status_check_thread.start()
     
@@ -174,7 +363,7 @@ class MCPServerGUI(tk.Tk):
                 
                 # Encontrar e encerrar diretamente os processos duplicados pelo sistema operacional
                 try:
-                    script_name = os.path.basename(server.script_path)
+                    script_name = server.script_name
                     pids_to_kill = []
                     
                     # Encontrar todos os processos relacionados a este script
@@ -233,28 +422,78 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         self.update_status("Processos duplicados foram encerrados")
         self.refresh_servers()
     
+    # Acima deste número de servidores a carga inicial da árvore é feita em
+    # lotes agendados com after_idle, em vez de uma rajada única de inserts
+    _LAZY_INSERT_THRESHOLD = 200
+    _LAZY_INSERT_BATCH = 200
+
+    def _insert_rows_batched(self, rows, start):
+        """Insere as linhas da árvore em lotes, cedendo o loop entre eles.
+
+        Mantém a interface responsiva para listas muito grandes: cada quadro
+        paga apenas um lote de inserções. O exists() protege contra linhas já
+        criadas por um refresh incremental que rode entre os lotes.
+        """
+        try:
+            if not self.servers_tree.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        end = min(start + self._LAZY_INSERT_BATCH, len(rows))
+        for row in rows[start:end]:
+            if not self.servers_tree.exists(row[0]):
+                self.servers_tree.insert("", "end", iid=row[0], values=row, open=False)
+            self._tree_row_cache[row[0]] = row
+
+        if end < len(rows):
+            self.after_idle(self._insert_rows_batched, rows, end)
+
     def populate_servers_list(self):
         """Popula a lista de servidores com informações básicas, sem verificar status."""
-        # Limpar a lista
-        for item in self.servers_tree.get_children():
-            self.servers_tree.delete(item)
-        
-        # Adicionar servidores à lista
+        # Limpar a lista (delete aceita vários itens numa única chamada,
+        # bem mais barato que um delete por item)
+        children = self.servers_tree.get_children()
+        if children:
+            self.servers_tree.delete(*children)
+
+        # Montar as linhas antes de tocar no widget
         servers = self.server_manager.get_all_servers()
-        for server in servers:
-            self.servers_tree.insert(
-                "", 
-                "end", 
-                values=(
-                    server.name, 
-                    server.status, 
-                    os.path.basename(server.script_path)
-                )
-            )
-        
+        rows = [
+            (server.name, server.status, server.script_name)
+            for server in servers
+        ]
+
+        # Adicionar servidores à lista (iid = nome do servidor, assim a
+        # seleção devolve o nome sem uma ida extra ao Tcl via item()).
+        # Listas muito grandes são inseridas em lotes via after_idle, para
+        # o custo por quadro ser proporcional ao lote e não ao total
+        if len(rows) > self._LAZY_INSERT_THRESHOLD:
+            self._tree_row_cache = {}
+            self._insert_rows_batched(rows, 0)
+        else:
+            # Com a árvore fora do layout durante a carga em lote, o Tk faz
+            # um único relayout ao repack em vez de um por inserção
+            if rows:
+                self.servers_tree.pack_forget()
+            for row in rows:
+                self.servers_tree.insert("", "end", iid=row[0], values=row, open=False)
+            if rows:
+                self.servers_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self._tree_row_cache = {row[0]: row for row in rows}
+
+        # Recalcular do zero o conjunto de servidores ativos; daqui em
+        # diante ele é mantido incrementalmente pelas mudanças de status
+        self._running_names = {
+            server.name for server in servers
+            if server.status == ServerStatus.RUNNING
+        }
+
         # Selecionar o primeiro item da lista, se houver algum
-        if self.servers_tree.get_children():
-            first_item = self.servers_tree.get_children()[0]
+        # (uma única ida ao Tcl para obter os filhos)
+        children = self.servers_tree.get_children()
+        if children:
+            first_item = children[0]
             self.servers_tree.selection_set(first_item)
             self.servers_tree.focus_set()
             self.servers_tree.focus(first_item)
@@ -267,53 +506,122 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
     def _background_status_checker(self):
         """Função que roda em background para verificar periodicamente o status dos servidores."""
         try:
-            # Primeiro espere um pouco mais para a interface terminar de carregar completamente
-            time.sleep(2.5)
-            
+            # Primeiro espere um pouco mais para a interface terminar de carregar
+            # completamente (wait retorna True na hora se o encerramento chegar antes)
+            if self._stop_evt.wait(2.5):
+                return
+
             # Faça a primeira verificação (com um pequeno atraso)
-            self.after(100, self.refresh_servers)
-            
+            self._schedule_refresh(100)
+
             # Contador para verificação periódica de processos duplicados (a cada 5 minutos)
             duplicate_check_counter = 0
-            
-            # Loop de verificação periódica
-            while self.should_check_status:
-                # Espera 20 segundos entre verificações (aumentar o intervalo reduz o impacto)
-                time.sleep(20)
-                
+
+            # Loop de verificação periódica: wait(20) dorme entre verificações,
+            # mas acorda imediatamente quando o evento de parada é sinalizado
+            while not self._stop_evt.wait(20):
+                # Não agendar nada se a janela já foi destruída
+                if not self.winfo_exists():
+                    break
+
                 # Incrementar contador
                 duplicate_check_counter += 1
-                
+
                 # A cada 15 ciclos (5 minutos), verificar processos duplicados
                 if duplicate_check_counter >= 15:
                     duplicate_check_counter = 0
                     self.after(500, self.check_for_duplicate_processes)
-                
+
                 # Executa a verificação na thread principal usando after com um atraso maior
                 # Usar 300ms ajuda a garantir que a interface não travará
-                self.after(300, self.refresh_servers)
+                self._schedule_refresh(300)
         except Exception as e:
             print(f"Erro no verificador de status: {str(e)}")
+
+    def _schedule_refresh(self, delay_ms):
+        """Agenda um refresh_servers se nenhum outro estiver pendente.
+
+        Se uma verificação anterior ainda não terminou (por exemplo, sondas
+        lentas com muitos servidores), o tick é simplesmente descartado em
+        vez de empilhar callbacks na thread da interface.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after(delay_ms, self._refresh_wrapper)
+
+    def _refresh_wrapper(self):
+        """Executa refresh_servers e libera o flag de refresh pendente."""
+        try:
+            self.refresh_servers()
+        finally:
+            self._refresh_pending = False
     
     def _load_app_config(self):
         """Carrega as configurações da aplicação."""
         self.app_config = {}
-        config_file = os.path.join(Path(__file__).resolve().parent.parent, "config", "app_config.json")
-        
+        config_file = CONFIG_FILE
+        cache_file = config_file + ".cache"
+
+        try:
+            stat_json = os.stat(config_file)
+        except OSError:
+            return  # Sem arquivo de configuração, mantém os padrões
+
+        # Tentar primeiro o cache binário (pickle desserializa bem mais rápido
+        # que o parse de JSON na inicialização). O cache só é válido se o
+        # mtime dele bater exatamente com o do JSON original.
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    self.app_config = json.load(f)
+            if os.stat(cache_file).st_mtime_ns == stat_json.st_mtime_ns:
+                with open(cache_file, 'rb') as f:
+                    self.app_config = pickle.loads(f.read())
+                return
+        except Exception:
+            pass  # Cache ausente ou inválido; recai no JSON
+
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                self.app_config = json.load(f)
         except Exception as e:
             print(f"Erro ao carregar configurações: {str(e)}")
+            return
+
+        # Regravar o cache binário para as próximas inicializações (escrita
+        # atômica: grava num temporário e troca com os.replace). Falhas aqui
+        # não podem impedir a aplicação de abrir.
+        try:
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(pickle.dumps(self.app_config, protocol=5))
+            os.replace(tmp_file, cache_file)
+            # Igualar o mtime do cache ao do JSON para a validação acima
+            os.utime(cache_file, ns=(stat_json.st_atime_ns, stat_json.st_mtime_ns))
+        except Exception:
+            pass
     
     def _apply_theme_from_config(self):
         """Aplica o tema definido nas configurações."""
         theme = self.app_config.get("theme")
-        
+
         if not theme:
             return  # Usar o tema padrão se não estiver configurado
-        
+
+        # Tema validado numa execução anterior: aplicar direto, sem pagar o
+        # theme_names() (varredura de diretórios + avaliação Tcl) de novo
+        if self.app_config.get("theme_validated"):
+            try:
+                try:
+                    from ttkthemes import ThemedStyle
+                    ThemedStyle(self).set_theme(theme)
+                    return
+                except ImportError:
+                    pass
+                self.style.theme_use(theme)
+                return
+            except tk.TclError:
+                # Tema sumiu desde a última validação; refaz a checagem completa
+                self.app_config["theme_validated"] = False
+
         try:
             # Tentar importar ThemedStyle se o ttkthemes estiver disponível
             try:
@@ -321,15 +629,57 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
                 themed_style = ThemedStyle(self)
                 if theme in themed_style.theme_names():
                     themed_style.set_theme(theme)
+                    self._mark_theme_validated()
                     return
             except ImportError:
                 pass  # Continuar com os temas padrão se ttkthemes não estiver disponível
-            
+
             # Tentar usar os temas padrão do ttk
             if theme in self.style.theme_names():
                 self.style.theme_use(theme)
+                self._mark_theme_validated()
         except Exception as e:
             print(f"Erro ao aplicar tema '{theme}': {str(e)}")
+
+    def _mark_theme_validated(self):
+        """Registra no app_config que o tema configurado existe e foi aplicado."""
+        if self.app_config.get("theme_validated"):
+            return
+
+        self.app_config["theme_validated"] = True
+        self.save_app_config()
+
+    def save_app_config(self):
+        """Grava o app_config em JSON compacto, com escrita atômica e fsync.
+
+        O JSON continua sendo a fonte da verdade; a serialização compacta
+        (sem indentação) encolhe o arquivo e o parse nas inicializações que
+        caírem fora do cache binário.
+        """
+        try:
+            data = json.dumps(self.app_config, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            tmp_file = CONFIG_FILE + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, CONFIG_FILE)
+        except Exception as e:
+            print(f"Erro ao salvar configurações: {str(e)}")
+            return
+
+        # Regravar o cache binário já em sincronia com o novo JSON, para a
+        # próxima inicialização não precisar reparsear nada
+        try:
+            stat_json = os.stat(CONFIG_FILE)
+            cache_file = CONFIG_FILE + ".cache"
+            tmp_cache = cache_file + ".tmp"
+            with open(tmp_cache, 'wb') as f:
+                f.write(pickle.dumps(self.app_config, protocol=5))
+            os.replace(tmp_cache, cache_file)
+            os.utime(cache_file, ns=(stat_json.st_atime_ns, stat_json.st_mtime_ns))
+        except Exception:
+            pass
     
     def check_venv_exists(self):
         """
@@ -338,33 +688,50 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         Returns:
             bool: True se o ambiente virtual existir e as dependências estiverem instaladas, False caso contrário
         """
+        project_root = PROJECT_DIR
+
+        # Uma única varredura do diretório raiz serve tanto para localizar o
+        # log.txt quanto para o .venv logo abaixo (DirEntry guarda o stat,
+        # dispensando os pares exists+isdir por candidato)
+        try:
+            with os.scandir(project_root) as it:
+                entries = {e.name: e for e in it}
+        except OSError:
+            entries = {}
+
         # Obter caminho do projeto a partir do log.txt se existir
-        log_paths = [
-            "log.txt",
-            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "log.txt")
-        ]
-        
+        log_paths = ["log.txt"]  # relativo ao diretório atual
+        log_entry = entries.get("log.txt")
+        if log_entry is not None and log_entry.is_file():
+            log_paths.append(log_entry.path)
+
         project_path = None
         for log_path in log_paths:
             if os.path.exists(log_path):
                 try:
-                    with open(log_path, "r", encoding="utf-8") as f:
-                        log_content = f.read()
-                        # Procurar o caminho do projeto no log
-                        for line in log_content.splitlines():
+                    # Ler linha a linha e parar na primeira ocorrência, em vez
+                    # de carregar o log inteiro na memória com read()
+                    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+                        for line in f:
                             if "Caminho do Projeto:" in line:
-                                project_path = line.split("Caminho do Projeto:")[1].strip()
+                                project_path = line.split("Caminho do Projeto:", 1)[1].strip()
                                 break
                 except:
                     pass
+            if project_path:
+                break
         
         # Se não encontrou o caminho do projeto, usa o diretório atual
         if not project_path:
-            project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
+            project_path = project_root
+
         # Verifica se existe o diretório .venv no caminho do projeto
-        venv_path = os.path.join(project_path, ".venv")
-        venv_exists = os.path.exists(venv_path) and os.path.isdir(venv_path)
+        if project_path == project_root:
+            # Reaproveita a varredura já feita do diretório raiz
+            venv_entry = entries.get(".venv")
+            venv_exists = venv_entry is not None and venv_entry.is_dir(follow_symlinks=False)
+        else:
+            venv_exists = os.path.isdir(os.path.join(project_path, ".venv"))
         
         # Verifica se as dependências estão instaladas
         deps_installed = self.check_dependencies()
@@ -380,15 +747,18 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         """
         required_modules = ['tkinter', 'rich', 'psutil']
         missing_modules = []
-        
+
         for module in required_modules:
+            if module == 'tkinter':
+                # tkinter já está importado se este código está rodando
+                continue
+
             try:
-                if module == 'tkinter':
-                    # tkinter já está importado se este código está rodando
-                    continue
-                
-                __import__(module)
-            except ImportError:
+                # find_spec só consulta os metadados do módulo, sem executar
+                # o import completo (bem mais barato para módulos pesados)
+                if importlib.util.find_spec(module) is None:
+                    missing_modules.append(module)
+            except (ImportError, ValueError):
                 missing_modules.append(module)
         
         if missing_modules:
@@ -406,7 +776,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         Pergunta ao usuário se deseja configurar o ambiente virtual e executa o quick_setup.py
         """
         # Obter caminho do projeto
-        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        project_dir = PROJECT_DIR
         venv_path = os.path.join(project_dir, ".venv")
         
         # Criar uma janela de diálogo personalizada
@@ -457,6 +827,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
             if os.name == 'nt':  # Windows
                 os.startfile(project_dir)
             else:  # Linux/macOS
+                import subprocess
                 subprocess.Popen(['xdg-open', project_dir])
         
         # Botão para abrir o diretório do projeto
@@ -506,9 +877,11 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         """
         Executa o script quick_setup.py
         """
+        import subprocess
+
         try:
             # Obter caminho do projeto
-            project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            project_dir = PROJECT_DIR
             quick_setup_path = os.path.join(project_dir, "quick_setup.py")
             
             # Verificar se o arquivo existe
@@ -535,7 +908,26 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
                 command = [python_exe, quick_setup_path]
                 creation_flags = subprocess.CREATE_NEW_CONSOLE
             else:  # Linux/macOS
-                command = ['xterm', '-e', python_exe, quick_setup_path]
+                import shutil
+
+                # Usar o emulador de terminal que o usuário já tem, em vez de
+                # assumir o xterm (ausente na maioria dos desktops atuais)
+                terminal = next(
+                    (t for t in (
+                        os.environ.get('TERMINAL'),
+                        'x-terminal-emulator',
+                        'gnome-terminal',
+                        'konsole',
+                        'xterm'
+                    ) if t and shutil.which(t)),
+                    None
+                )
+
+                if terminal:
+                    command = [terminal, '-e', python_exe, quick_setup_path]
+                else:
+                    # Sem emulador de terminal: executar direto em segundo plano
+                    command = [python_exe, quick_setup_path]
                 creation_flags = 0
             
             # Informação para o usuário
@@ -893,51 +1285,61 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         self.config_manager = ConfigManager(self.config_tab)
         self.config_manager.pack(fill=tk.BOTH, expand=True)
     
+    # Tabela de estados dos botões de ação por status do servidor; a chave
+    # None cobre a ausência de seleção e _BUTTON_STATES_BUSY os estados
+    # transitórios (Iniciando/Parando/Erro). Dados em vez de cadeias de if.
+    _ACTION_BUTTONS = ('start', 'stop', 'restart', 'edit', 'remove', 'tools', 'resources', 'prompts')
+    _SELECTED_ENABLED = {'edit': '!disabled', 'remove': '!disabled', 'tools': '!disabled',
+                         'resources': '!disabled', 'prompts': '!disabled'}
+    _BUTTON_STATES_BUSY = {'start': 'disabled', 'stop': 'disabled', 'restart': 'disabled',
+                           **_SELECTED_ENABLED}
+    _BUTTON_STATES = {
+        ServerStatus.RUNNING: {'start': 'disabled', 'stop': '!disabled', 'restart': '!disabled',
+                               **_SELECTED_ENABLED},
+        ServerStatus.STOPPED: {'start': '!disabled', 'stop': 'disabled', 'restart': 'disabled',
+                               **_SELECTED_ENABLED},
+        None: {name: 'disabled' for name in _ACTION_BUTTONS},
+    }
+
+    def _apply_button_states(self, status):
+        """Aplica a tabela de estados dos botões para o status informado."""
+        buttons = getattr(self, '_action_button_map', None)
+        if buttons is None:
+            buttons = self._action_button_map = {
+                'start': self.start_button,
+                'stop': self.stop_button,
+                'restart': self.restart_button,
+                'edit': self.edit_button,
+                'remove': self.remove_button,
+                'tools': self.tools_button,
+                'resources': self.resources_button,
+                'prompts': self.prompts_button,
+            }
+
+        states = self._BUTTON_STATES.get(status, self._BUTTON_STATES_BUSY)
+        for name, state in states.items():
+            buttons[name].state([state])
+
     def on_server_selected(self, event):
         """Manipula o evento de seleção de um servidor na lista."""
         selection = self.servers_tree.selection()
         if not selection:
             # Nenhum item selecionado, desabilitar botões
+            self._last_selected_name = None
             self.update_server_details(None)
-            self.start_button.config(state=tk.DISABLED)
-            self.stop_button.config(state=tk.DISABLED)
-            self.restart_button.config(state=tk.DISABLED)
-            self.edit_button.config(state=tk.DISABLED)
-            self.remove_button.config(state=tk.DISABLED)
-            self.tools_button.config(state=tk.DISABLED)
-            self.resources_button.config(state=tk.DISABLED)
-            self.prompts_button.config(state=tk.DISABLED)
+            self._apply_button_states(None)
             return
-        
-        # Obter o servidor selecionado
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
-        server = self.server_manager.get_server(server_name)
+
+        # Obter o servidor selecionado (o iid da árvore é o próprio nome)
+        self._last_selected_name = selection[0]
+        server = self.server_manager.get_server(selection[0])
         
         if server:
             # Atualizar detalhes do servidor
             self.update_server_details(server)
             
-            # Habilitar/desabilitar botões com base no status
-            if server.status == ServerStatus.RUNNING:
-                self.start_button.config(state=tk.DISABLED)
-                self.stop_button.config(state=tk.NORMAL)
-                self.restart_button.config(state=tk.NORMAL)
-            elif server.status == ServerStatus.STOPPED:
-                self.start_button.config(state=tk.NORMAL)
-                self.stop_button.config(state=tk.DISABLED)
-                self.restart_button.config(state=tk.DISABLED)
-            else:  # STARTING, STOPPING ou ERROR
-                self.start_button.config(state=tk.DISABLED)
-                self.stop_button.config(state=tk.DISABLED)
-                self.restart_button.config(state=tk.DISABLED)
-            
-            # Sempre habilitar botões de edição, remoção, ferramentas, recursos e prompts
-            self.edit_button.config(state=tk.NORMAL)
-            self.remove_button.config(state=tk.NORMAL)
-            self.tools_button.config(state=tk.NORMAL)
-            self.resources_button.config(state=tk.NORMAL)
-            self.prompts_button.config(state=tk.NORMAL)
+            # Habilitar/desabilitar botões conforme a tabela de estados
+            self._apply_button_states(server.status)
     
     def update_server_details(self, server):
         """Atualiza as informações de detalhes do servidor selecionado."""
@@ -947,7 +1349,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
             self.server_script_label.config(text=server.script_path)
             
             # Obter o diretório do ambiente virtual (diretório pai do script)
-            venv_dir = os.path.dirname(server.script_path) if server.script_path else "-"
+            venv_dir = server.script_dir or "-"
             self.server_config_label.config(text=venv_dir)
         else:
             self.server_name_label.config(text="-")
@@ -957,34 +1359,50 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
     
     def refresh_servers(self):
         """Atualiza a lista de servidores."""
-        # Usar uma thread separada para verificar status
-        def check_status_thread():
+        # Sonda executada no pool de threads, fora da thread da interface
+        def check_status_probe():
             try:
                 # Verificar o status atual dos processos dos servidores
                 changes = self.server_manager.check_servers_status()
-                
-                # Atualizar a interface na thread principal usando after com um pequeno atraso
-                # para dar tempo para o sistema processar outras mensagens da interface
-                self.after(100, lambda: self._update_servers_ui(changes))
+
+                # Devolver o resultado pela fila; _drain_ui_queue aplica as
+                # mudanças na thread principal
+                self._ui_queue.put(changes)
             except Exception as e:
                 print(f"Erro ao verificar status: {str(e)}")
-        
+
         # Indicar visualmente que a atualização está em andamento
         self.update_status("Verificando status dos servidores...")
-        
-        # Usar uma prioridade muito baixa para esta thread
-        thread = threading.Thread(target=check_status_thread, daemon=True)
-        thread.start()
+
+        # Submeter ao pool em vez de criar uma thread nova a cada refresh
+        self._probe_pool.submit(check_status_probe)
+
+    def _drain_ui_queue(self):
+        """Aplica na interface os resultados de status produzidos pelo pool.
+
+        Reagenda a si mesmo com after(100) enquanto a aplicação estiver
+        aberta; os itens já enfileirados são processados em lote.
+        """
+        try:
+            while True:
+                changes = self._ui_queue.get_nowait()
+                self._update_servers_ui(changes)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            print(f"Erro ao aplicar status na interface: {str(e)}")
+
+        if self.winfo_exists():
+            self.after(100, self._drain_ui_queue)
     
     def _update_servers_ui(self, changes):
         """Atualiza a interface com base nas mudanças de status detectadas."""
         # Guardar a seleção atual antes de limpar a lista
+        # (o iid do item é o nome do servidor, sem precisar consultar values)
         current_selection = None
         selection = self.servers_tree.selection()
         if selection:
-            item = self.servers_tree.item(selection[0])
-            if "values" in item and len(item["values"]) > 0:
-                current_selection = item["values"][0]  # Nome do servidor selecionado
+            current_selection = selection[0]
         
         # Se houve mudanças no status, registrar no log
         if changes:
@@ -1008,88 +1426,140 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
             # Apenas atualizar a interface se houve mudanças no status
             self._refresh_servers_tree(current_selection)
         else:
-            # Se não houve mudanças, apenas atualizar a barra de status sem reconstruir a árvore
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.update_status(f"Status verificado às {current_time}")
+            # Se não houve mudanças, apenas atualizar a barra de status sem
+            # reconstruir a árvore. O horário formatado é cacheado por
+            # segundo: dentro do mesmo segundo não há novo strftime e o
+            # update_status descarta o texto repetido
+            t = int(time.time())
+            if t != getattr(self, "_last_status_t", None):
+                self._last_status_t = t
+                self._last_status_s = time.strftime("%H:%M:%S", time.localtime(t))
+            self.update_status(f"Status verificado às {self._last_status_s}")
     
     def _refresh_servers_tree(self, current_selection=None):
-        """Atualiza a árvore de servidores preservando a seleção atual."""
-        # Limpar a lista
-        for item in self.servers_tree.get_children():
-            self.servers_tree.delete(item)
-        
-        # Adicionar servidores à lista
+        """Atualiza a árvore de servidores preservando a seleção atual.
+
+        Em vez de limpar e reinserir tudo, compara as linhas desejadas com o
+        cache da última renderização (_tree_row_cache) e só executa os
+        insert/delete/item das linhas que mudaram — custo O(mudanças), e
+        praticamente zero quando nada mudou.
+        """
         servers = self.server_manager.get_all_servers()
-        server_items = {}  # Mapear nome do servidor para o item na árvore
-        
-        for server in servers:
-            item_id = self.servers_tree.insert(
-                "", 
-                "end", 
-                values=(
-                    server.name, 
-                    server.status, 
-                    os.path.basename(server.script_path)
-                )
-            )
-            server_items[server.name] = item_id
+        new_rows = {
+            server.name: (server.name, server.status, server.script_name)
+            for server in servers
+        }
+        old_rows = getattr(self, "_tree_row_cache", {})
+
+        # Remover linhas de servidores que não existem mais
+        for name in old_rows.keys() - new_rows.keys():
+            if self.servers_tree.exists(name):
+                self.servers_tree.delete(name)
+
+        # Inserir novas linhas e atualizar as que mudaram (iid = nome)
+        for name, row in new_rows.items():
+            if name not in old_rows:
+                self.servers_tree.insert("", "end", iid=name, values=row)
+            elif old_rows[name] != row:
+                self.servers_tree.item(name, values=row)
+
+        self._tree_row_cache = new_rows
+        server_items = new_rows  # Nome do servidor também é o iid do item
         
-        # Restaurar a seleção anterior se o servidor ainda existe na lista
+        # Restaurar a seleção anterior se o servidor ainda existe na lista.
+        # Detalhes e botões só são reprocessados se o servidor selecionado
+        # mudou desde a última renderização — em um tick de poll sem
+        # alterações, restaurar a mesma seleção não exige redesenhar nada
         if current_selection and current_selection in server_items:
-            item_to_select = server_items[current_selection]
+            item_to_select = current_selection
             # Selecionar o item
             self.servers_tree.selection_set(item_to_select)
             self.servers_tree.focus_set()
             self.servers_tree.focus(item_to_select)
-            # Disparar manualmente o evento de seleção para atualizar os detalhes
-            self.on_server_selected(None)
-        # Se não temos uma seleção anterior ou o servidor foi removido, selecionar o primeiro se houver algum
-        elif self.servers_tree.get_children():
-            first_item = self.servers_tree.get_children()[0]
-            self.servers_tree.selection_set(first_item)
+        # Se não temos uma seleção anterior ou o servidor foi removido,
+        # selecionar o primeiro se houver algum (new_rows preserva a ordem
+        # de inserção, dispensando uma ida ao Tcl via get_children)
+        elif new_rows:
+            item_to_select = next(iter(new_rows))
+            self.servers_tree.selection_set(item_to_select)
             self.servers_tree.focus_set()
-            self.servers_tree.focus(first_item)
-            # Disparar manualmente o evento de seleção para atualizar os detalhes
-            self.on_server_selected(None)
-        
+            self.servers_tree.focus(item_to_select)
+        else:
+            item_to_select = None
+
+        if item_to_select != getattr(self, "_last_selected_name", None):
+            self._last_selected_name = item_to_select
+            if item_to_select is not None:
+                # Disparar manualmente o evento de seleção para atualizar os detalhes
+                self.on_server_selected(None)
+
         # Atualizar contagem
         self.update_server_count()
     
     def update_server_count(self):
-        """Atualiza o contador de servidores ativos."""
-        active_count = sum(1 for server in self.server_manager.get_all_servers() 
-                           if server.status == ServerStatus.RUNNING)
+        """Atualiza o contador de servidores ativos (mantido incrementalmente)."""
+        active_count = len(self._running_names)
         self.active_servers_label.config(text=f"Servidores ativos: {active_count}")
     
     def on_server_status_changed(self, server_name, status):
         """Callback chamado quando o status de um servidor muda."""
-        # Atualizar imediatamente o status visual na árvore
-        server = self.server_manager.get_server(server_name)
-        if server:
-            # Atualizar o item na árvore
-            for item_id in self.servers_tree.get_children():
-                item = self.servers_tree.item(item_id)
-                if item["values"] and item["values"][0] == server_name:
-                    # Atualiza o valor do status diretamente na árvore
-                    self.servers_tree.item(item_id, values=(
-                        server_name,
-                        status,
-                        os.path.basename(server.script_path)
-                    ))
-                    # Se este é o item selecionado, atualizar os detalhes
-                    if self.servers_tree.selection() and self.servers_tree.selection()[0] == item_id:
-                        self.update_server_details(server)
-                        self.on_server_selected(None)  # Atualizar estado dos botões
-                    break
-        
-        # Atualizar a contagem de servidores ativos
-        self.update_server_count()
-        
         # Registrar no log
         self.log(f"Servidor '{server_name}' mudou para status '{status}'")
-        
-        # Atualizar a barra de status
-        self.update_status(f"Servidor '{server_name}' agora está '{status}'")
+
+        # Manter o conjunto de servidores ativos em dia (contagem O(1)
+        # em update_server_count, sem varrer a lista a cada mudança)
+        if status == ServerStatus.RUNNING:
+            self._running_names.add(server_name)
+        else:
+            self._running_names.discard(server_name)
+
+        # Apenas marcar o servidor como sujo; o flush agendado aplica as
+        # mudanças acumuladas de uma vez (no máximo ~20 renderizações/s,
+        # mesmo sob rajadas de callbacks)
+        self._dirty_servers.add(server_name)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Agenda um flush das mudanças de status, se ainda não houver um."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self.after(50, self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Aplica na árvore as mudanças de status acumuladas desde o último flush."""
+        dirty = self._dirty_servers
+        self._dirty_servers = set()
+        self._flush_scheduled = False
+
+        selection = self.servers_tree.selection()
+        selected = selection[0] if selection else None
+
+        for server_name in dirty:
+            server = self.server_manager.get_server(server_name)
+            if server is None:
+                continue
+
+            # O iid do item é o nome do servidor: atualizar só a coluna de
+            # status da linha afetada, sem varrer nem reconstruir a árvore
+            if self.servers_tree.exists(server_name):
+                self.servers_tree.set(server_name, "status", server.status)
+                self._tree_row_cache[server_name] = (server_name, server.status, server.script_name)
+
+            # Se este é o item selecionado, atualizar os detalhes
+            if selected == server_name:
+                self.update_server_details(server)
+                self.on_server_selected(None)  # Atualizar estado dos botões
+
+        # Contagem e barra de status uma única vez por flush
+        self.update_server_count()
+        if len(dirty) == 1:
+            server_name = next(iter(dirty))
+            server = self.server_manager.get_server(server_name)
+            if server:
+                self.update_status(f"Servidor '{server_name}' agora está '{server.status}'")
+        elif dirty:
+            self.update_status(f"{len(dirty)} servidores atualizados")
     
     def on_log_added(self, server_name, log_entry):
         """Callback chamado quando um log é adicionado a um servidor."""
@@ -1102,32 +1572,26 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         
         # Iniciar servidor
         if self.server_manager.start_server(server_name):
             # Atualizar status na barra
             self.update_status(f"Iniciando servidor '{server_name}'...")
             
-            # Atualizar imediatamente o status visual na árvore
+            # Atualizar imediatamente o status visual na árvore (acesso
+            # direto pelo iid; só a coluna de status muda, então tree.set
+            # evita reescrever a linha inteira)
             server = self.server_manager.get_server(server_name)
-            if server:
-                # Atualizar o item na árvore
-                for item_id in self.servers_tree.get_children():
-                    item = self.servers_tree.item(item_id)
-                    if item["values"][0] == server_name:
-                        # Atualiza o valor do status diretamente na árvore
-                        self.servers_tree.item(item_id, values=(
-                            server_name,
-                            server.status,
-                            os.path.basename(server.script_path)
-                        ))
-                        # Atualizar detalhes do servidor na parte inferior da interface
-                        self.update_server_details(server)
-                        # Atualizar estado dos botões
-                        self.on_server_selected(None)
-                        break
+            if server and self.servers_tree.exists(server_name):
+                self.servers_tree.set(server_name, "status", server.status)
+                self._tree_row_cache[server_name] = (
+                    server_name, server.status, server.script_name
+                )
+                # Atualizar detalhes do servidor na parte inferior da interface
+                self.update_server_details(server)
+                # Atualizar estado dos botões
+                self.on_server_selected(None)
     
     def stop_selected_server(self):
         """Para o servidor selecionado."""
@@ -1135,8 +1599,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if not server:
@@ -1159,12 +1622,9 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         # Mostrar indicador visual de processo sendo encerrado
         self.update_status(f"Encerrando servidor '{server_name}'...")
         
-        # Atualizar estado visual do servidor na árvore
-        for item_id in self.servers_tree.get_children():
-            item = self.servers_tree.item(item_id)
-            if item["values"][0] == server_name:
-                self.servers_tree.item(item_id, tags=("stopping",))
-                break
+        # Atualizar estado visual do servidor na árvore (acesso direto pelo iid)
+        if self.servers_tree.exists(server_name):
+            self.servers_tree.item(server_name, tags=("stopping",))
         
         # Parar servidor no gerenciador
         if self.server_manager.stop_server(server_name):
@@ -1178,8 +1638,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if not server:
@@ -1202,12 +1661,9 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         # Mostrar indicador visual de reinicialização
         self.update_status(f"Reiniciando servidor '{server_name}'...")
         
-        # Atualizar estado visual do servidor na árvore
-        for item_id in self.servers_tree.get_children():
-            item = self.servers_tree.item(item_id)
-            if item["values"][0] == server_name:
-                self.servers_tree.item(item_id, tags=("stopping",))
-                break
+        # Atualizar estado visual do servidor na árvore (acesso direto pelo iid)
+        if self.servers_tree.exists(server_name):
+            self.servers_tree.item(server_name, tags=("stopping",))
         
         # Iniciar thread para reiniciar o servidor (para não bloquear a interface)
         thread = threading.Thread(
@@ -1236,30 +1692,20 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
                 self.update_status(f"Erro ao parar o servidor '{server_name}' para reinicialização")
                 return
             
-            # 2. Aguardar o servidor parar completamente
-            max_attempts = 30  # 30 * 0.2 = 6 segundos máximo
-            for attempt in range(max_attempts):
-                server = self.server_manager.get_server(server_name)  # Atualizar estado
-                if server.status == ServerStatus.STOPPED:
-                    break
-                time.sleep(0.2)
-            
+            # 2. Aguardar o servidor parar completamente (evento sinalizado
+            # pelo ServerManager na transição para STOPPED, sem polling)
+            stopped = self.server_manager.server_stopped_event(server_name).wait(timeout=6.0)
+
             # Se ainda não parou, registrar aviso
-            if server.status != ServerStatus.STOPPED:
-                self.log(f"Aviso: Servidor '{server_name}' não parou completamente após {max_attempts * 0.2} segundos")
-            
-            # 3. Iniciar o servidor novamente após uma pequena pausa
-            time.sleep(0.5)  # Pequena pausa para garantir que tudo foi encerrado
-            
-            # 4. Atualizar o status visual
+            if not stopped:
+                self.log(f"Aviso: Servidor '{server_name}' não parou completamente após 6 segundos")
+
+            # 3. Atualizar o status visual
             self.update_status(f"Reiniciando servidor '{server_name}'...")
             
-            # 5. Iniciar o servidor
-            for item_id in self.servers_tree.get_children():
-                item = self.servers_tree.item(item_id)
-                if item["values"][0] == server_name:
-                    self.servers_tree.item(item_id, tags=("starting",))
-                    break
+            # 4. Iniciar o servidor (acesso direto pelo iid)
+            if self.servers_tree.exists(server_name):
+                self.servers_tree.item(server_name, tags=("starting",))
             
             if self.server_manager.start_server(server_name):
                 self.log(f"Servidor '{server_name}' reiniciado com sucesso")
@@ -1273,36 +1719,38 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
     
     def edit_selected_server(self):
         """Abre o script do servidor com o programa padrão do sistema."""
+        import subprocess
+
         selection = self.servers_tree.selection()
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if server:
-            # Verificar se o arquivo existe
-            if os.path.exists(server.script_path):
-                try:
-                    # Usar a função de sistema para abrir o arquivo com o programa padrão
-                    # ou deixar o usuário escolher o programa
-                    if sys.platform == 'win32':
-                        os.startfile(server.script_path)
-                    elif sys.platform == 'darwin':
-                        subprocess.call(['open', server.script_path])
-                    else:  # Linux/Unix
-                        subprocess.call(['xdg-open', server.script_path])
-                    
-                    self.log(f"Arquivo '{os.path.basename(server.script_path)}' aberto para edição")
-                except Exception as e:
-                    error_msg = f"Erro ao abrir arquivo: {str(e)}"
-                    show_error_message("Erro", error_msg)
-                    self.log(error_msg)
-            else:
+            # Sem checagem prévia de existência: os.startfile já levanta
+            # FileNotFoundError, e o exists() só adicionava um syscall e
+            # uma janela de corrida entre a verificação e a abertura
+            try:
+                # Usar a função de sistema para abrir o arquivo com o programa padrão
+                # ou deixar o usuário escolher o programa
+                if sys.platform == 'win32':
+                    os.startfile(server.script_path)
+                elif sys.platform == 'darwin':
+                    subprocess.call(['open', server.script_path])
+                else:  # Linux/Unix
+                    subprocess.call(['xdg-open', server.script_path])
+
+                self.log(f"Arquivo '{server.script_name}' aberto para edição")
+            except FileNotFoundError:
                 error_msg = f"Arquivo não encontrado: {server.script_path}"
                 show_error_message("Erro", error_msg)
                 self.log(error_msg)
+            except Exception as e:
+                error_msg = f"Erro ao abrir arquivo: {str(e)}"
+                show_error_message("Erro", error_msg)
+                self.log(error_msg)
     
     def remove_selected_server(self):
         """Remove o servidor selecionado da interface e de todos os arquivos de configuração."""
@@ -1310,8 +1758,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if not server:
@@ -1337,12 +1784,12 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
             
             # Remover servidor do gerenciador
             if self.server_manager.remove_server(server_name):
-                # Remover o item diretamente da árvore sem esperar pelo refresh
+                # Remover o item diretamente da árvore; a linha e os caches
+                # já ficam corretos, sem precisar de um refresh completo
                 self.servers_tree.delete(selection[0])
-                
-                # Atualizar a lista de servidores para garantir consistência
-                self._refresh_servers_tree()
-                
+                self._tree_row_cache.pop(selection[0], None)
+                self._running_names.discard(server_name)
+
                 # Atualizar contador
                 self.update_server_count()
                 
@@ -1441,17 +1888,14 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         # Converter o nome para snake_case para o arquivo
         snake_case_name = self._to_snake_case(name)
         
-        # Obter o diretório raiz do projeto
-        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Definir caminho do diretório mcp_server (não dentro de .venv)
-        mcp_server_dir = os.path.join(project_dir, "mcp_server")
-        
+        # Diretório mcp_server (não dentro de .venv), resolvido no import
+        mcp_server_dir = MCP_SERVER_DIR
+
         # Verificar se o diretório existe
         if not os.path.exists(mcp_server_dir):
             show_error_message(
-                "Erro", 
-                f"A pasta mcp_server não foi encontrada em: {project_dir}"
+                "Erro",
+                f"A pasta mcp_server não foi encontrada em: {PROJECT_DIR}"
             )
             return
         
@@ -1461,43 +1905,42 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
         # Criar ou atualizar servidor
         if not original_name:  # Novo servidor
             # Verificar se o arquivo já existe
+            write_template = False
             if os.path.exists(script_path):
                 # Perguntar se deseja substituir
                 if not ask_yes_no(
-                    "Arquivo existente", 
+                    "Arquivo existente",
                     f"O arquivo '{snake_case_name}.py' já existe. Deseja usar este arquivo?"
                 ):
                     return
             else:
-                # Criar um arquivo Python básico com o template MCP
-                try:
-                    with open(script_path, "w", encoding="utf-8") as f:
-                        f.write(self._get_mcp_template(name, snake_case_name))
-                        
-                    self.log(f"Arquivo '{snake_case_name}.py' criado em '{mcp_server_dir}'")
-                except Exception as e:
-                    show_error_message(
-                        "Erro ao criar arquivo", 
-                        f"Não foi possível criar o arquivo: {str(e)}"
-                    )
-                    return
-            
+                # O arquivo com o template MCP será criado pela thread de
+                # persistência, para não travar o fechamento do diálogo
+                write_template = True
+
             # Criar o servidor
             server = Server(name, script_path, None)
             if self.server_manager.add_server(server):
-                # Atualizar as configurações dos clientes (mcp.json, etc.)
-                self._update_client_configs(name, script_path, mcp_server_dir)
-                
-                self.update_status(f"Servidor '{name}' adicionado")
-                # Chamando _refresh_servers_tree() diretamente ao invés de refresh_servers()
-                self._refresh_servers_tree(name)  # Passar o nome para selecionar o novo servidor
+                # Fechar o diálogo imediatamente; a escrita do script e a
+                # atualização das configurações dos clientes (que dispara
+                # where.exe/which) seguem em uma thread de trabalho
                 dialog.destroy()
+                self.update_status(f"Salvando servidor '{name}'...")
+                threading.Thread(
+                    target=self._persist_server_worker,
+                    args=(name, script_path, mcp_server_dir,
+                          snake_case_name if write_template else None,
+                          True, f"Servidor '{name}' adicionado"),
+                    daemon=True
+                ).start()
         else:  # Atualizar servidor existente
             server = self.server_manager.get_server(original_name)
             if not server:
                 show_error_message("Erro", f"Servidor '{original_name}' não encontrado")
                 return
-                
+
+            write_template = False
+
             # Se o nome mudou, precisamos atualizar o arquivo
             if name != original_name:
                 # Obter caminho do script existente para poder renomeá-lo
@@ -1531,42 +1974,86 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
                         )
                         return
                 else:
-                    # Se não existe um arquivo no caminho antigo, cria um novo
-                    try:
-                        with open(script_path, "w", encoding="utf-8") as f:
-                            f.write(self._get_mcp_template(name, snake_case_name))
-                            
-                        self.log(f"Arquivo '{snake_case_name}.py' criado em '{mcp_server_dir}'")
-                    except Exception as e:
-                        show_error_message(
-                            "Erro ao criar arquivo", 
-                            f"Não foi possível criar o arquivo: {str(e)}"
-                        )
-                        return
+                    # Se não existe um arquivo no caminho antigo, a thread de
+                    # persistência cria um novo com o template MCP
+                    write_template = True
             else:
                 # Se o nome não mudou, manter o caminho do script
                 script_path = server.script_path
-            
+
             # Atualizar o servidor
             updates = {
                 "name": name,
                 "script_path": script_path
             }
-            
+
             if self.server_manager.update_server(original_name, **updates):
-                # Atualizar as configurações dos clientes (mcp.json, etc.)
-                # Se o nome mudou, remover a antiga configuração e adicionar a nova
-                if name != original_name:
-                    # Esta é uma simplificação. Idealmente, deveríamos editar as
-                    # configurações existentes para manter metadados, mas isso exigiria
-                    # mais trabalho.
-                    self._update_client_configs(name, script_path, mcp_server_dir)
-                    
-                self.update_status(f"Servidor '{name}' atualizado")
-                # Chamando _refresh_servers_tree() diretamente ao invés de refresh_servers()
-                self._refresh_servers_tree(name)  # Passar o nome para selecionar o novo servidor
+                # Fechar o diálogo imediatamente e delegar o trabalho de I/O
+                # (template e configurações dos clientes) à thread.
+                # As configurações só precisam ser reescritas se o nome mudou.
+                # Esta é uma simplificação. Idealmente, deveríamos editar as
+                # configurações existentes para manter metadados, mas isso exigiria
+                # mais trabalho.
                 dialog.destroy()
+                self.update_status(f"Salvando servidor '{name}'...")
+                threading.Thread(
+                    target=self._persist_server_worker,
+                    args=(name, script_path, mcp_server_dir,
+                          snake_case_name if write_template else None,
+                          name != original_name, f"Servidor '{name}' atualizado"),
+                    daemon=True
+                ).start()
     
+    def _persist_server_worker(self, name, script_path, mcp_server_dir,
+                               template_file_name, update_configs, status_message):
+        """
+        Executa o I/O de salvamento de um servidor fora da thread da interface.
+
+        Escreve o script com o template (quando necessário) e atualiza as
+        configurações dos clientes; a conclusão é devolvida à thread do Tk
+        via after(0, ...).
+
+        Args:
+            name: Nome do servidor
+            script_path: Caminho do script Python
+            mcp_server_dir: Diretório mcp_server
+            template_file_name: Nome do arquivo (sem extensão) para gerar o
+                template MCP, ou None se o script já existe
+            update_configs: Se as configurações dos clientes devem ser reescritas
+            status_message: Mensagem exibida na barra de status ao concluir
+        """
+        try:
+            if template_file_name:
+                try:
+                    with open(script_path, "w", encoding="utf-8") as f:
+                        f.write(self._get_mcp_template(name, template_file_name))
+
+                    self.log(f"Arquivo '{template_file_name}.py' criado em '{mcp_server_dir}'")
+                except Exception as e:
+                    show_error_message(
+                        "Erro ao criar arquivo",
+                        f"Não foi possível criar o arquivo: {str(e)}"
+                    )
+                    return
+
+            if update_configs:
+                # Atualizar as configurações dos clientes (mcp.json, etc.)
+                self._update_client_configs(name, script_path, mcp_server_dir)
+        finally:
+            self.after(0, lambda: self._on_server_persisted(name, status_message))
+
+    def _on_server_persisted(self, name, status_message):
+        """Conclui o salvamento na thread da interface (status e refresh)."""
+        try:
+            if not self.winfo_exists():
+                return
+            self.update_status(status_message)
+            # Chamando _refresh_servers_tree() diretamente ao invés de refresh_servers()
+            self._refresh_servers_tree(name)  # Passar o nome para selecionar o novo servidor
+        except tk.TclError:
+            # Janela fechada enquanto o salvamento terminava
+            pass
+
     def _update_client_configs(self, server_name, script_path, mcp_server_dir):
         """
         Atualiza os arquivos de configuração dos clientes.
@@ -1577,77 +2064,16 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
             mcp_server_dir: Diretório mcp_server
         """
         try:
-            # Determinar o caminho do executável uv.exe usando where.exe no Windows
-            uv_path = ""
-            
-            if os.name == 'nt':  # Windows
-                try:
-                    # Tentar encontrar uv.exe usando where.exe (ferramenta padrão do Windows)
-                    result = subprocess.run(
-                        ["where.exe", "uv.exe"], 
-                        capture_output=True, 
-                        text=True, 
-                        check=False
-                    )
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        # Pegar a primeira linha do resultado (primeiro caminho encontrado)
-                        uv_path = result.stdout.strip().split('\n')[0]
-                        self.log(f"Caminho do uv.exe encontrado: {uv_path}")
-                    else:
-                        # Se não encontrar, tentar encontrar em caminhos comuns
-                        common_paths = [
-                            os.path.expanduser("~/.local/bin/uv.exe"),
-                            os.path.expanduser("~/AppData/Local/Programs/Python/Python312/Scripts/uv.exe"),
-                            os.path.expanduser("~/pipx/venvs/uv/Scripts/uv.exe"),
-                            "C:\\Users\\JAMILE\\pipx\\venvs\\uv\\Scripts\\uv.exe"
-                        ]
-                        
-                        for path in common_paths:
-                            if os.path.exists(path):
-                                uv_path = path
-                                self.log(f"Caminho do uv.exe encontrado em caminhos comuns: {uv_path}")
-                                break
-                                
-                        if not uv_path:
-                            raise Exception("Não foi possível encontrar o executável uv.exe")
-                except Exception as e:
-                    self.log(f"Erro ao tentar encontrar uv.exe: {str(e)}")
-                    raise Exception(f"Não foi possível encontrar o executável uv.exe: {str(e)}")
-            else:  # Linux/macOS
-                try:
-                    # Tentar encontrar uv usando which (equivalente ao where no Unix)
-                    result = subprocess.run(
-                        ["which", "uv"], 
-                        capture_output=True, 
-                        text=True, 
-                        check=False
-                    )
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        uv_path = result.stdout.strip()
-                    else:
-                        # Tentar encontrar em caminhos comuns no Unix
-                        common_paths = [
-                            os.path.expanduser("~/.local/bin/uv"),
-                            "/usr/local/bin/uv"
-                        ]
-                        
-                        for path in common_paths:
-                            if os.path.exists(path):
-                                uv_path = path
-                                break
-                                
-                        if not uv_path:
-                            raise Exception("Não foi possível encontrar o executável uv")
-                except Exception as e:
-                    self.log(f"Erro ao tentar encontrar uv: {str(e)}")
-                    raise Exception(f"Não foi possível encontrar o executável uv: {str(e)}")
-            
-            # Se não encontrou uv.exe, lançar erro
-            if not uv_path:
-                raise Exception("Não foi possível determinar o caminho do executável uv")
-                
+            # Determinar o caminho do executável uv (memoizado; a busca com
+            # where.exe/which só acontece na primeira chamada)
+            try:
+                uv_path = _find_uv_path()
+                self.log(f"Caminho do uv encontrado: {uv_path}")
+            except Exception as e:
+                self.log(f"Erro ao tentar encontrar uv: {str(e)}")
+                raise Exception(f"Não foi possível encontrar o executável uv: {str(e)}")
+
+
             # Criação dos argumentos para executar o script
             argumentos = [
                 "--directory",
@@ -1692,50 +2118,7 @@ Nota: Processos duplicados geralmente ocorrem quando o mesmo servidor é configu
     
     def _get_mcp_template(self, name, file_name):
         """Retorna um template básico para um servidor MCP usando FastMCP."""
-        template = f'''"""
-Servidor MCP: {name}
-Arquivo: {file_name}.py
-
-Este servidor MCP foi gerado automaticamente pelo MCP Server Manager.
-"""
-from typing import Any
-from mcp.server.fastmcp import FastMCP
-
-# Inicializa o servidor FastMCP
-mcp = FastMCP("{name}", log_level="ERROR")
-
-@mcp.tool()
-async def hello(name: str = "Mundo") -> str:
-    """Retorna uma saudação personalizada.
-    
-    Args:
-        name: O nome para saudar. Padrão: "Mundo"
-        
-    Returns:
-        Uma mensagem de saudação personalizada
-    """
-    return f"Olá {{name}} do servidor {name}!"
-
-@mcp.tool()
-async def soma(a: float, b: float) -> float:
-    """Soma dois números.
-    
-    Args:
-        a: Primeiro número
-        b: Segundo número
-        
-    Returns:
-        A soma dos dois números
-    """
-    return a + b
-
-if __name__ == "__main__":
-    # Inicializa e executa o servidor
-    print("Iniciando o servidor MCP {name}...")
-    print("Use Ctrl+C para encerrar.")
-    mcp.run(transport='stdio')
-'''
-        return template
+        return _MCP_TEMPLATE.format(name=name, file_name=file_name)
     
     # Funções de callback para operações do menu
     def open_settings(self):
@@ -1762,24 +2145,115 @@ if __name__ == "__main__":
     # Funções de utilitários
     def update_status(self, message):
         """Atualiza a mensagem na barra de status."""
+        # Sem ida ao Tcl quando o texto não mudou (o tick de verificação
+        # chama isto a cada poll, muitas vezes com a mesma mensagem)
+        if message == getattr(self, "_last_status_text", None):
+            return
+        self._last_status_text = message
         self.status_label.config(text=message)
         self.update_idletasks()
     
+    # Limite de linhas mantidas no widget de logs; o excedente mais antigo
+    # é descartado a cada flush para o Text não crescer indefinidamente
+    _MAX_LOG_LINES = 5000
+
     def log(self, message):
-        """Adiciona uma mensagem ao log."""
-        self.logs_text.insert(tk.END, f"{message}\n")
-        self.logs_text.see(tk.END)  # Rola para o final
-    
+        """Adiciona uma mensagem ao log (descarregada em lote no widget)."""
+        self._log_buffer.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self._flush_log_buffer)
+
+    def _flush_log_buffer(self):
+        """Descarrega as mensagens de log acumuladas no widget de texto."""
+        self._log_flush_scheduled = False
+        if not self._log_buffer:
+            return
+
+        try:
+            if not self.logs_text.winfo_exists():
+                self._log_buffer.clear()
+                return
+
+            # Uma única inserção e uma única rolagem para todo o lote
+            texto = "\n".join(self._log_buffer) + "\n"
+            self._log_buffer.clear()
+            self.logs_text.insert(tk.END, texto)
+
+            # Limitar o tamanho do widget às últimas _MAX_LOG_LINES linhas
+            self.logs_text.delete(1.0, f"end-{self._MAX_LOG_LINES}l")
+
+            self.logs_text.see(tk.END)  # Rola para o final
+        except tk.TclError:
+            # Janela sendo destruída durante o flush
+            pass
+
     def clear_logs(self):
         """Limpa os logs."""
         self.logs_text.delete(1.0, tk.END)
     
     def refresh_logs(self):
-        """Atualiza os logs."""
-        self.update_status("Logs atualizados")
+        """Atualiza os logs recarregando o arquivo de log mais recente."""
+        # Procurar o arquivo de log mais recente entre os servidores
+        log_file = None
+        newest = -1.0
+        for server in self.server_manager.get_all_servers():
+            path = getattr(server, "log_file", None)
+            if path and os.path.exists(path):
+                mtime = os.path.getmtime(path)
+                if mtime > newest:
+                    newest = mtime
+                    log_file = path
+
+        if not log_file:
+            self.update_status("Logs atualizados")
+            return
+
+        self._stream_log_file(log_file)
+
+    def _stream_log_file(self, path, step=64 * 1024):
+        """Carrega um arquivo de log no widget em blocos intercalados.
+
+        O arquivo é mapeado com mmap e inserido em fatias de 64 KB agendadas
+        com after(10), então o loop principal intercala quadros de pintura
+        entre os blocos e a interface continua respondendo mesmo com logs de
+        vários megabytes.
+        """
+        import mmap
+
+        try:
+            f = open(path, "rb")
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Arquivo vazio não pode ser mapeado
+                f.close()
+                self.update_status("Logs atualizados")
+                return
+        except Exception as e:
+            self.log(f"Erro ao abrir log '{path}': {str(e)}")
+            return
+
+        self.logs_text.delete(1.0, tk.END)
+        total = len(mm)
+
+        def _stream(pos=0):
+            end = min(pos + step, total)
+            self.logs_text.insert(tk.END, mm[pos:end].decode("utf-8", "replace"))
+            if end < total:
+                self.after(10, lambda: _stream(end))
+            else:
+                self.logs_text.see(tk.END)
+                mm.close()
+                f.close()
+                self.update_status(f"Logs atualizados ({os.path.basename(path)})")
+
+        _stream()
     
     def export_logs(self):
         """Exporta os logs para um arquivo."""
+        from tkinter import filedialog
+
         try:
             filetypes = [("Arquivos de texto", "*.txt"), ("Todos os arquivos", "*.*")]
             filename = filedialog.asksaveasfilename(
@@ -1796,8 +2270,13 @@ if __name__ == "__main__":
     
     def on_closing(self):
         """Função chamada ao fechar a aplicação."""
-        # Parar o verificador de status
-        self.should_check_status = False
+        # Parar o verificador de status (acorda a thread na hora, sem esperar
+        # o restante do intervalo de 20 segundos)
+        self._stop_evt.set()
+
+        # Encerrar o pool de sondas sem esperar sondas em andamento
+        if hasattr(self, "_probe_pool"):
+            self._probe_pool.shutdown(wait=False)
         
         # Verificar se há servidores em execução
         active_servers = [s for s in self.server_manager.get_all_servers() 
@@ -1816,14 +2295,92 @@ if __name__ == "__main__":
         # Fechar a aplicação
         self.destroy()
 
+    def _get_dialog(self, key, factory):
+        """Retorna um diálogo cacheado, criando-o apenas na primeira chamada.
+
+        Args:
+            key: Chave do diálogo no cache
+            factory: Função sem argumentos que constrói o diálogo
+
+        Returns:
+            tk.Toplevel: O diálogo pronto para ser reexibido
+        """
+        dialog = self._dialogs.get(key)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = factory()
+            self._dialogs[key] = dialog
+        return dialog
+
+    def _get_items_window(self, key, min_size, size):
+        """Obtém a janela reutilizável de ferramentas/recursos/prompts.
+
+        A casca (Toplevel, título, notebook e botão Fechar) é construída uma
+        única vez; fechar apenas esconde a janela com withdraw(). A cada
+        chamada as abas da exibição anterior são destruídas, restando ao
+        chamador repopular o notebook.
+
+        Args:
+            key: Chave do diálogo no cache
+            min_size: Tupla (largura, altura) mínima da janela
+            size: Tupla (largura, altura) inicial da janela
+
+        Returns:
+            tk.Toplevel: Janela com os atributos title_label e items_notebook
+        """
+        def factory():
+            window = tk.Toplevel(self)
+            window.transient(self)  # Fazer esta janela filho da janela principal
+
+            # Tamanho e posicionamento
+            window.minsize(*min_size)
+            center_window(window, *size)
+
+            # Configurar grid
+            window.columnconfigure(0, weight=1)
+            window.rowconfigure(0, weight=0)
+            window.rowconfigure(1, weight=1)
+
+            # Título
+            window.title_label = ttk.Label(window, text="", font=("Arial", 12, "bold"))
+            window.title_label.grid(row=0, column=0, sticky="w", padx=10, pady=10)
+
+            # Frame principal
+            main_frame = ttk.Frame(window)
+            main_frame.grid(row=1, column=0, sticky="nsew")
+            main_frame.columnconfigure(0, weight=1)
+            main_frame.rowconfigure(0, weight=1)
+
+            # Notebook para organizar os itens
+            window.items_notebook = ttk.Notebook(main_frame)
+            window.items_notebook.grid(row=0, column=0, sticky="nsew")
+
+            # Fechar esconde a janela em vez de destruí-la, para reutilização
+            ttk.Button(
+                window,
+                text="Fechar",
+                command=window.withdraw
+            ).grid(row=2, column=0, sticky="e", padx=10, pady=10)
+            window.protocol("WM_DELETE_WINDOW", window.withdraw)
+
+            return window
+
+        window = self._get_dialog(key, factory)
+
+        # Limpar as abas da exibição anterior
+        for tab_id in window.items_notebook.tabs():
+            window.items_notebook.nametowidget(tab_id).destroy()
+
+        return window
+
     def show_server_tools(self):
         """Exibe uma janela com as ferramentas MCP do servidor selecionado."""
+        import re
+
         selection = self.servers_tree.selection()
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if not server or not server.script_path or not os.path.exists(server.script_path):
@@ -1855,37 +2412,11 @@ if __name__ == "__main__":
                 self.edit_selected_server()
             return
         
-        # Criar janela de ferramentas
-        tools_window = tk.Toplevel(self)
+        # Obter a janela reutilizável de ferramentas (criada uma única vez)
+        tools_window = self._get_items_window("server_tools", (600, 500), (700, 600))
         tools_window.title(f"Ferramentas MCP - {server_name}")
-        tools_window.transient(self)  # Fazer esta janela filho da janela principal
-        tools_window.grab_set()  # Tornar a janela modal
-        
-        # Tamanho e posicionamento
-        tools_window.minsize(600, 500)  # Aumentado de 500x400 para 600x500
-        center_window(tools_window, 700, 600)  # Aumentado de 600x500 para 700x600
-        
-        # Configurar grid
-        tools_window.columnconfigure(0, weight=1)
-        tools_window.rowconfigure(0, weight=0)
-        tools_window.rowconfigure(1, weight=1)
-        
-        # Título
-        ttk.Label(
-            tools_window, 
-            text=f"Ferramentas do Servidor: {server_name}", 
-            font=("Arial", 12, "bold")
-        ).grid(row=0, column=0, sticky="w", padx=10, pady=10)
-        
-        # Frame principal
-        main_frame = ttk.Frame(tools_window)
-        main_frame.grid(row=1, column=0, sticky="nsew")
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(0, weight=1)
-        
-        # Criar notebook para organizar as ferramentas
-        tools_notebook = ttk.Notebook(main_frame)
-        tools_notebook.grid(row=0, column=0, sticky="nsew")
+        tools_window.title_label.config(text=f"Ferramentas do Servidor: {server_name}")
+        tools_notebook = tools_window.items_notebook
         
         # Adicionar uma aba para cada ferramenta (sem duplicações)
         tab_names = set()  # Conjunto para controlar abas já adicionadas
@@ -2042,15 +2573,14 @@ if __name__ == "__main__":
                             padx=5, 
                             pady=5)
         
-        # Botão de fechar
-        ttk.Button(
-            tools_window, 
-            text="Fechar", 
-            command=tools_window.destroy
-        ).grid(row=2, column=0, sticky="e", padx=10, pady=10)
+        # Reexibir a janela e torná-la modal
+        tools_window.deiconify()
+        tools_window.grab_set()
 
     def import_server(self):
         """Importa um arquivo de servidor Python existente."""
+        from tkinter import filedialog
+
         # Abrir diálogo para selecionar arquivo
         file_path = filedialog.askopenfilename(
             title="Selecionar Arquivo de Servidor",
@@ -2070,17 +2600,14 @@ if __name__ == "__main__":
         file_name = os.path.basename(file_path)
         server_name = os.path.splitext(file_name)[0]
         
-        # Obter o diretório raiz do projeto
-        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Definir caminho do diretório mcp_server
-        mcp_server_dir = os.path.join(project_dir, "mcp_server")
-        
+        # Diretório mcp_server, resolvido no import
+        mcp_server_dir = MCP_SERVER_DIR
+
         # Verificar se o diretório existe
         if not os.path.exists(mcp_server_dir):
             show_error_message(
-                "Erro", 
-                f"A pasta mcp_server não foi encontrada em: {project_dir}"
+                "Erro",
+                f"A pasta mcp_server não foi encontrada em: {PROJECT_DIR}"
             )
             return
             
@@ -2136,12 +2663,13 @@ if __name__ == "__main__":
 
     def show_server_resources(self):
         """Exibe uma janela com os recursos MCP do servidor selecionado."""
+        import re
+
         selection = self.servers_tree.selection()
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if not server or not server.script_path or not os.path.exists(server.script_path):
@@ -2173,37 +2701,11 @@ if __name__ == "__main__":
                 self.edit_selected_server()
             return
         
-        # Criar janela de recursos
-        resources_window = tk.Toplevel(self)
+        # Obter a janela reutilizável de recursos (criada uma única vez)
+        resources_window = self._get_items_window("server_resources", (600, 500), (700, 600))
         resources_window.title(f"Recursos MCP - {server_name}")
-        resources_window.transient(self)  # Fazer esta janela filho da janela principal
-        resources_window.grab_set()  # Tornar a janela modal
-        
-        # Tamanho e posicionamento
-        resources_window.minsize(600, 500)
-        center_window(resources_window, 700, 600)
-        
-        # Configurar grid
-        resources_window.columnconfigure(0, weight=1)
-        resources_window.rowconfigure(0, weight=0)
-        resources_window.rowconfigure(1, weight=1)
-        
-        # Título
-        ttk.Label(
-            resources_window, 
-            text=f"Recursos do Servidor: {server_name}", 
-            font=("Arial", 12, "bold")
-        ).grid(row=0, column=0, sticky="w", padx=10, pady=10)
-        
-        # Frame principal
-        main_frame = ttk.Frame(resources_window)
-        main_frame.grid(row=1, column=0, sticky="nsew")
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(0, weight=1)
-        
-        # Criar notebook para organizar os recursos
-        resources_notebook = ttk.Notebook(main_frame)
-        resources_notebook.grid(row=0, column=0, sticky="nsew")
+        resources_window.title_label.config(text=f"Recursos do Servidor: {server_name}")
+        resources_notebook = resources_window.items_notebook
         
         # Adicionar uma aba para cada recurso (sem duplicações)
         tab_names = set()  # Conjunto para controlar abas já adicionadas
@@ -2359,12 +2861,9 @@ if __name__ == "__main__":
                             padx=5, 
                             pady=5)
         
-        # Botão de fechar
-        ttk.Button(
-            resources_window, 
-            text="Fechar", 
-            command=resources_window.destroy
-        ).grid(row=2, column=0, sticky="e", padx=10, pady=10)
+        # Reexibir a janela e torná-la modal
+        resources_window.deiconify()
+        resources_window.grab_set()
 
     def show_server_prompts(self):
         """Exibe uma janela com os prompts MCP do servidor selecionado."""
@@ -2372,8 +2871,7 @@ if __name__ == "__main__":
         if not selection:
             return
         
-        item = self.servers_tree.item(selection[0])
-        server_name = item["values"][0]
+        server_name = selection[0]  # O iid do item é o nome do servidor
         server = self.server_manager.get_server(server_name)
         
         if not server or not server.script_path or not os.path.exists(server.script_path):
@@ -2405,37 +2903,11 @@ if __name__ == "__main__":
                 self.edit_selected_server()
             return
         
-        # Criar janela de prompts
-        prompts_window = tk.Toplevel(self)
+        # Obter a janela reutilizável de prompts (criada uma única vez)
+        prompts_window = self._get_items_window("server_prompts", (650, 500), (750, 600))
         prompts_window.title(f"Prompts MCP - {server_name}")
-        prompts_window.transient(self)  # Fazer esta janela filho da janela principal
-        prompts_window.grab_set()  # Tornar a janela modal
-        
-        # Tamanho e posicionamento
-        prompts_window.minsize(650, 500)
-        center_window(prompts_window, 750, 600)
-        
-        # Configurar grid
-        prompts_window.columnconfigure(0, weight=1)
-        prompts_window.rowconfigure(0, weight=0)
-        prompts_window.rowconfigure(1, weight=1)
-        
-        # Título
-        ttk.Label(
-            prompts_window, 
-            text=f"Prompts do Servidor: {server_name}", 
-            font=("Arial", 12, "bold")
-        ).grid(row=0, column=0, sticky="w", padx=10, pady=10)
-        
-        # Frame principal - Reduzir padding para 0
-        main_frame = ttk.Frame(prompts_window, padding=(0, 0, 0, 0))
-        main_frame.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(0, weight=1)
-        
-        # Criar notebook para organizar os prompts
-        prompts_notebook = ttk.Notebook(main_frame)
-        prompts_notebook.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
+        prompts_window.title_label.config(text=f"Prompts do Servidor: {server_name}")
+        prompts_notebook = prompts_window.items_notebook
         
         # Adicionar uma aba para cada prompt (sem duplicações)
         tab_names = set()  # Conjunto para controlar abas já adicionadas
@@ -2559,12 +3031,9 @@ if __name__ == "__main__":
                                padx=0, 
                                pady=0)
         
-        # Botão de fechar
-        ttk.Button(
-            prompts_window, 
-            text="Fechar", 
-            command=prompts_window.destroy
-        ).grid(row=2, column=0, sticky="e", padx=10, pady=10)
+        # Reexibir a janela e torná-la modal
+        prompts_window.deiconify()
+        prompts_window.grab_set()
 
 
 def main():
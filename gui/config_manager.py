@@ -96,9 +96,10 @@ class ConfigManager(ttk.Frame):
             # Garantir que o diretório de configuração existe
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             
-            # Salvar configurações
+            # Salvar configurações (JSON compacto: menos bytes para gravar
+            # e para parsear nas próximas inicializações)
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
+                json.dump(self.config, f, separators=(',', ':'), ensure_ascii=False)
                 
             show_info_message("Configurações", "Configurações salvas com sucesso.")
         except Exception as e:
@@ -58,6 +58,11 @@ class Server:
         """
         self.name = name
         self.script_path = script_path
+        # Nome do arquivo e diretório do script, calculados uma única vez
+        # (evita chamar os.path.basename/dirname repetidamente nas
+        # verificações de status e atualizações da árvore)
+        self.script_name = os.path.basename(script_path) if script_path else ""
+        self.script_dir = os.path.dirname(script_path) if script_path else ""
         self.config_file = config_file
         self.port = port
         self.status = ServerStatus.STOPPED
@@ -129,6 +134,15 @@ class ServerManager:
         
         # Lista de servidores
         self.servers = []
+
+        # Índice por nome para busca O(1) (get_server é chamado a cada
+        # clique na árvore e a cada verificação de status)
+        self._by_name = {}
+
+        # Eventos de parada por servidor: sinalizados quando o status
+        # transita para STOPPED, permitindo que threads aguardem a parada
+        # sem ficar em polling com time.sleep
+        self._stop_events = {}
         
         # Carregar servidores
         self._load_servers()
@@ -146,6 +160,7 @@ class ServerManager:
         """
         data = load_json_file(self.servers_config_file, default=[])
         self.servers = [Server.from_dict(server_data) for server_data in data]
+        self._by_name = {server.name: server for server in self.servers}
     
     def _load_client_config_servers(self):
         """
@@ -164,7 +179,7 @@ class ServerManager:
                     if 'mcpServers' in config_data:
                         for name, server_config in config_data['mcpServers'].items():
                             # Verificar se o servidor já existe
-                            if not any(s.name == name for s in self.servers):
+                            if name not in self._by_name:
                                 # Extrair informações do servidor
                                 script_path = None
                                 config_file = None
@@ -244,18 +259,18 @@ class ServerManager:
             bool: True se o servidor foi adicionado com sucesso
         """
         # Verificar se já existe um servidor com o mesmo nome
-        for existing_server in self.servers:
-            if existing_server.name == server.name:
-                # Não mostrar erro se estamos carregando de configuração
-                if save_config:
-                    show_error_message(
-                        "Erro ao adicionar servidor", 
-                        f"Já existe um servidor com o nome '{server.name}'"
-                    )
-                return False
+        if server.name in self._by_name:
+            # Não mostrar erro se estamos carregando de configuração
+            if save_config:
+                show_error_message(
+                    "Erro ao adicionar servidor", 
+                    f"Já existe um servidor com o nome '{server.name}'"
+                )
+            return False
         
         # Adicionar servidor
         self.servers.append(server)
+        self._by_name[server.name] = server
         
         # Salvar configuração se solicitado
         if save_config:
@@ -316,7 +331,7 @@ class ServerManager:
         # 2. Tentar remover o script do servidor, se existir
         if hasattr(server, 'script_path') and server.script_path and os.path.exists(server.script_path):
             try:
-                script_name = os.path.basename(server.script_path)
+                script_name = server.script_name
                 show_info_message(
                     "Informação",
                     f"O arquivo '{script_name}' não foi excluído automaticamente."
@@ -326,6 +341,7 @@ class ServerManager:
         
         # 3. Remover da lista de servidores em memória
         self.servers = [s for s in self.servers if s.name != server_name]
+        self._by_name.pop(server_name, None)
         
         # 4. Salvar a lista de servidores no arquivo de configuração
         self._save_servers()
@@ -348,10 +364,7 @@ class ServerManager:
         Returns:
             Server: O servidor encontrado ou None se não encontrado
         """
-        for server in self.servers:
-            if server.name == server_name:
-                return server
-        return None
+        return self._by_name.get(server_name)
     
     def get_all_servers(self):
         """
@@ -393,7 +406,17 @@ class ServerManager:
                 
                 # Atualizar propriedade
                 setattr(server, prop, value)
-        
+
+        # Reindexar se o servidor foi renomeado
+        if "name" in kwargs and server.name != server_name:
+            self._by_name.pop(server_name, None)
+            self._by_name[server.name] = server
+
+        # Manter nome e diretório do arquivo em sincronia com o novo caminho
+        if "script_path" in kwargs:
+            server.script_name = os.path.basename(server.script_path) if server.script_path else ""
+            server.script_dir = os.path.dirname(server.script_path) if server.script_path else ""
+
         # Salvar alterações
         self._save_servers()
         return True
@@ -550,7 +573,7 @@ class ServerManager:
                         project_dir = os.path.dirname(server.script_path)
                     
                     # Argumentos padrão para uv
-                    cmd.extend(["--directory", project_dir, "run", os.path.basename(server.script_path)])
+                    cmd.extend(["--directory", project_dir, "run", server.script_name])
                     
                     # Definir diretório de trabalho
                     cwd = project_dir
@@ -861,7 +884,7 @@ class ServerManager:
             
             # Buscar processos pelo nome do script (caso o PID tenha mudado)
             try:
-                script_name = os.path.basename(server.script_path)
+                script_name = server.script_name
                 
                 # Verificar todos os processos Python em execução
                 for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
@@ -990,13 +1013,40 @@ class ServerManager:
             except:
                 pass
     
+    def server_stopped_event(self, server_name):
+        """
+        Retorna o threading.Event associado à parada de um servidor.
+
+        O evento é sinalizado sempre que o status do servidor transita para
+        STOPPED e limpo nas demais transições, permitindo aguardar a parada
+        com evt.wait(timeout) em vez de polling.
+
+        Args:
+            server_name: Nome do servidor
+
+        Returns:
+            threading.Event: Evento de parada do servidor
+        """
+        evt = self._stop_events.get(server_name)
+        if evt is None:
+            evt = threading.Event()
+            self._stop_events[server_name] = evt
+        return evt
+
     def _notify_status_changed(self, server):
         """
         Notifica os listeners sobre a mudança de status de um servidor.
-        
+
         Args:
             server: O servidor
         """
+        # Sinalizar (ou limpar) o evento de parada do servidor
+        evt = self.server_stopped_event(server.name)
+        if server.status == ServerStatus.STOPPED:
+            evt.set()
+        else:
+            evt.clear()
+
         if self.on_server_status_changed:
             try:
                 self.on_server_status_changed(server.name, server.status)
@@ -1053,7 +1103,7 @@ class ServerManager:
             # Se o processo não foi encontrado pelo PID e temos um caminho de script válido,
             # buscar nos processos filtrados previamente
             if not is_running and server.script_path:
-                script_name = os.path.basename(server.script_path)
+                script_name = server.script_name
                 
                 # Procurar apenas nos processos Python já identificados
                 for proc in python_processes:
@@ -1118,7 +1168,7 @@ class ServerManager:
         # Para cada servidor, identificar processos e suas relações
         for server in self.servers:
             if server.script_path:
-                script_name = os.path.basename(server.script_path)
+                script_name = server.script_name
                 
                 # Encontrar todos os processos para este script
                 script_processes = []